@@ -1,51 +1,172 @@
-from datetime import datetime, timedelta
+import base64
+import hashlib
+import hmac
+import json
+import re
+import sys
+import time
+from datetime import timedelta
 from typing import Optional
-from jose import JWTError, jwt
+import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from cache import TTLCache
 from config import settings
 from schemas import AdminInfo
 
 security = HTTPBearer()
 
+# Token settings are fixed for the process lifetime, so resolve them once
+# instead of on every encode/decode
+_SECRET_KEY = settings.SECRET_KEY.encode()
+_ALGORITHM = settings.ALGORITHM
+_DEFAULT_EXPIRE_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_ADMIN_PHONE = sys.intern(settings.ADMIN_PHONE)
+
+# The signing algorithm, its prepared key and the encoded header never change,
+# so tokens are assembled directly instead of re-resolving them per encode
+_SIGNER = jwt.get_algorithm_by_name(_ALGORITHM)
+_SIGNING_KEY = _SIGNER.prepare_key(_SECRET_KEY)
+_JWT_HEADER_B64 = base64.urlsafe_b64encode(
+    json.dumps({"alg": _ALGORITHM, "typ": "JWT"}, separators=(",", ":")).encode()
+).rstrip(b"=")
+
+# Only the claims we actually issue are checked when decoding
+_DECODE_ALGORITHMS = (_ALGORITHM,)
+_DECODE_OPTIONS = {"verify_aud": False, "verify_iss": False, "require": ["exp", "sub"]}
+
+# There is a single admin identity, so every authenticated request shares it
+_ADMIN_INFO = AdminInfo(phone=_ADMIN_PHONE)
+
+# The same bearer token is replayed on every admin request during its
+# lifetime, so verified payloads are reused for a few seconds. Concurrent
+# requests with one token need no extra coalescing: verify_token never
+# yields to the event loop, so the first caller fills the cache before the
+# next one runs.
+_token_cache = TTLCache(maxsize=10_000, ttl=5)
+
+# Recently rejected tokens fail fast without being re-parsed; the short TTL
+# limits how long a bogus entry can linger
+_rejected_tokens = TTLCache(maxsize=50_000, ttl=30)
+
+def _token_key(token: str) -> bytes:
+    """Fixed-size cache key so raw tokens are never held in memory"""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+_B64URL_RE = re.compile(r"[A-Za-z0-9_-]*")
+
+def _b64url_decode(segment: str) -> bytes:
+    """Strict unpadded base64url, so no other spelling of a token verifies"""
+    if len(segment) % 4 == 1 or not _B64URL_RE.fullmatch(segment):
+        raise ValueError("Invalid base64url segment")
+    return base64.b64decode(
+        segment + "=" * (-len(segment) % 4), altchars=b"-_", validate=True
+    )
+
+def _b64url_encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+def _verify_hs256(signing_input: bytes, signature: bytes, key: bytes) -> bool:
+    """One-shot HMAC-SHA256 check, avoiding per-call HMAC object construction"""
+    return hmac.compare_digest(hmac.digest(key, signing_input, "sha256"), signature)
+
+def _credentials_error() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create JWT access token"""
-    to_encode = data.copy()
+    # JWT exp is integer epoch seconds, so skip datetime arithmetic entirely
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = int(time.time()) + int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = int(time.time()) + _DEFAULT_EXPIRE_SECONDS
 
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-    return encoded_jwt
+    payload = json.dumps(data | {"exp": expire}, separators=(",", ":")).encode()
+    signing_input = _JWT_HEADER_B64 + b"." + _b64url_encode(payload)
+    signature = _SIGNER.sign(signing_input, _SIGNING_KEY)
+    return (signing_input + b"." + _b64url_encode(signature)).decode()
+
+def _decode_token(token: str) -> dict:
+    # Reject malformed or expired tokens before paying for the HMAC check
+    if token.count(".") != 2:
+        raise _credentials_error()
+    signing_input, _, signature_b64 = token.rpartition(".")
+    header_b64, _, payload_b64 = signing_input.partition(".")
+    try:
+        header = json.loads(_b64url_decode(header_b64))
+        payload = json.loads(_b64url_decode(payload_b64))
+        exp = payload["exp"]
+        alg = header.get("alg")
+    except (ValueError, KeyError, TypeError, AttributeError):
+        raise _credentials_error()
+    now = time.time()
+    if not isinstance(exp, (int, float)) or exp <= now or "sub" not in payload:
+        raise _credentials_error()
+    # As PyJWT does: a token is not valid before its nbf or iat
+    for claim in ("nbf", "iat"):
+        value = payload.get(claim)
+        if value is not None and (not isinstance(value, (int, float)) or value > now):
+            raise _credentials_error()
+
+    if _ALGORITHM == "HS256":
+        try:
+            signature = _b64url_decode(signature_b64)
+        except ValueError:
+            raise _credentials_error()
+        if alg != "HS256" or not _verify_hs256(signing_input.encode(), signature, _SECRET_KEY):
+            raise _credentials_error()
+    else:
+        try:
+            payload = jwt.decode(
+                token, _SECRET_KEY, algorithms=_DECODE_ALGORITHMS, options=_DECODE_OPTIONS
+            )
+        except jwt.PyJWTError:
+            raise _credentials_error()
+    return payload
 
 def verify_token(token: str) -> dict:
     """Verify JWT token and return payload"""
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    key = _token_key(token)
+    payload = _token_cache.get(key)
+    if payload is not None:
         return payload
-    except JWTError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    if _rejected_tokens.get(key):
+        raise _credentials_error()
+
+    try:
+        payload = _decode_token(token)
+    except HTTPException:
+        _rejected_tokens.set(key, True)
+        raise
+
+    # Never serve a cached payload past the token's own expiry
+    _token_cache.set(key, payload, ttl=payload.get("exp", 0) - time.time())
+    return payload
 
 def verify_admin_credentials(phone: str, otp: str) -> bool:
-    """Verify admin phone and OTP"""
-    return phone == settings.ADMIN_PHONE and otp == settings.ADMIN_OTP
+    """Verify admin phone and OTP in constant time"""
+    # Evaluate both comparisons so timing does not reveal which one failed
+    phone_ok = hmac.compare_digest(phone.encode(), settings.ADMIN_PHONE.encode())
+    otp_ok = hmac.compare_digest(otp.encode(), settings.ADMIN_OTP.encode())
+    return phone_ok & otp_ok
 
 async def get_current_admin(credentials: HTTPAuthorizationCredentials = Depends(security)) -> AdminInfo:
     """Dependency to get current admin from token"""
+    # Deliberately async even though nothing is awaited: FastAPI awaits async
+    # dependencies inline but dispatches plain `def` ones to the threadpool
     token = credentials.credentials
     payload = verify_token(token)
 
     phone: str = payload.get("sub")
-    if phone is None or phone != settings.ADMIN_PHONE:
+    # Pointer comparison first, full string compare only if that misses
+    if phone is None or (phone is not _ADMIN_PHONE and phone != _ADMIN_PHONE):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
         )
 
-    return AdminInfo(phone=phone)
+    return _ADMIN_INFO
@@ -0,0 +1,52 @@
+"""
+Seed metadata for the blog posts created by create_blogs.py
+"""
+from dataclasses import dataclass
+from typing import Tuple
+
+@dataclass(frozen=True, slots=True)
+class BlogSeed:
+    slug: str
+    title: str
+    description: str
+    tags: str
+    image_url: str
+
+# SEO-Optimized Blog Posts; each body lives in content/<slug>.md
+BLOGS: Tuple[BlogSeed, ...] = (
+    BlogSeed(
+        slug="building-scalable-microservices-with-go-and-fastapi-a-complete-guide",
+        title="Building Scalable Microservices with Go and FastAPI: A Complete Guide",
+        description="Learn how to architect and build production-ready microservices using Go and FastAPI. Covers system design, API gateways, load balancing, and achieving 99.9% uptime.",
+        tags="microservices,go,fastapi,python,backend,system-design,docker,api-gateway,tushar-agrawal",
+        image_url="https://images.unsplash.com/photo-1558494949-ef010cbdcc31?w=1200",
+    ),
+    BlogSeed(
+        slug="hipaa-compliant-healthcare-saas-security-best-practices-for-2025",
+        title="HIPAA-Compliant Healthcare SaaS: Security Best Practices for 2025",
+        description="Essential security practices for building HIPAA and DPDP compliant healthcare applications. Learn from real-world implementation handling 500+ daily patients.",
+        tags="healthcare,hipaa,security,compliance,saas,python,backend,tushar-agrawal,data-protection",
+        image_url="https://images.unsplash.com/photo-1576091160399-112ba8d25d1d?w=1200",
+    ),
+    BlogSeed(
+        slug="ai-powered-ocr-for-medical-reports-reducing-manual-errors-by-90",
+        title="AI-Powered OCR for Medical Reports: Reducing Manual Errors by 90%",
+        description="How we built a Python OCR system that processes 1,000+ daily medical reports with 90% error reduction. Complete implementation guide with code examples.",
+        tags="ocr,python,ai,machine-learning,healthcare,automation,cv2,tesseract,tushar-agrawal",
+        image_url="https://images.unsplash.com/photo-1551288049-bebda4e38f71?w=1200",
+    ),
+    BlogSeed(
+        slug="event-driven-architecture-with-kafka-real-time-inventory-management",
+        title="Event-Driven Architecture with Kafka: Real-Time Inventory Management",
+        description="Learn how to build event-driven systems using Apache Kafka. Real-world example of inventory management platform serving 20+ businesses with sub-100ms latency.",
+        tags="kafka,event-driven,microservices,go,real-time,distributed-systems,tushar-agrawal,architecture",
+        image_url="https://images.unsplash.com/photo-1551288049-bebda4e38f71?w=1200",
+    ),
+    BlogSeed(
+        slug="zero-downtime-deployment-with-docker-and-nginx-from-4-hours-to-20-minutes",
+        title="Zero-Downtime Deployment with Docker and Nginx: From 4 Hours to 20 Minutes",
+        description="How we achieved 92% reduction in deployment time using Docker, Nginx, and blue-green deployment strategy. Complete guide with real production setup.",
+        tags="docker,devops,nginx,deployment,ci-cd,zero-downtime,blue-green,tushar-agrawal,automation",
+        image_url="https://images.unsplash.com/photo-1605745341112-85968b19335b?w=1200",
+    ),
+)
@@ -1,5 +1,6 @@
+from dataclasses import dataclass
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Tuple
 
 class Settings(BaseSettings):
     # Security
@@ -13,16 +14,43 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    SQL_ECHO: bool = False
 
     # CORS
     CORS_ORIGINS: str
 
-    @property
-    def cors_origins_list(self) -> List[str]:
-        return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
+    # Runtime ("dev" enables auto-reload when running main.py directly)
+    ENV: str = "production"
+    # Server processes for main.py outside dev. Each opens its own database
+    # pools (up to 40 connections on PostgreSQL) and blog cache, so raise it
+    # only with max_connections in mind
+    WORKERS: int = 2
 
     class Config:
         env_file = ".env"
         case_sensitive = True
 
-settings = Settings()
+@dataclass(frozen=True, slots=True)
+class FrozenSettings:
+    """Validated settings snapshot; plain slot access at runtime"""
+    SECRET_KEY: str
+    ALGORITHM: str
+    ACCESS_TOKEN_EXPIRE_MINUTES: int
+    ADMIN_PHONE: str
+    ADMIN_OTP: str
+    DATABASE_URL: str
+    CORS_ORIGINS: str
+    SQL_ECHO: bool
+    ENV: str
+    WORKERS: int
+
+def load_settings() -> FrozenSettings:
+    """Parse and validate the environment once, then freeze the result"""
+    return FrozenSettings(**Settings().model_dump())
+
+settings = load_settings()
+
+# Parsed once at startup; empty entries (e.g. a trailing comma) are dropped
+CORS_ORIGINS_TUPLE: Tuple[str, ...] = tuple(
+    origin.strip() for origin in settings.CORS_ORIGINS.split(",") if origin.strip()
+)
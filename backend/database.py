@@ -2,11 +2,23 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sess
 from sqlalchemy.orm import declarative_base
 from config import settings
 
-# Create async engine
+# Explicit pool sizing for server databases; SQLite picks its own pool class
+pool_options = {} if settings.DATABASE_URL.startswith("sqlite") else {
+    "pool_size": 20,
+    "max_overflow": 10,
+    "pool_recycle": 1800,
+}
+
+# Reads are short autocommit statements, so the read-only engine gets a small
+# pool of its own; per worker the two engines open at most 40 connections
+ro_pool_options = {**pool_options, "pool_size": 5, "max_overflow": 5} if pool_options else {}
+
+# Create async engine; SQL logging is opt-in via SQL_ECHO
 engine = create_async_engine(
     settings.DATABASE_URL,
-    echo=True,
-    future=True
+    echo=settings.SQL_ECHO,
+    future=True,
+    **pool_options
 )
 
 # Create session maker
@@ -16,6 +28,23 @@ async_session_maker = async_sessionmaker(
     expire_on_commit=False
 )
 
+# Read-only endpoints use a separate autocommit engine: no BEGIN per request,
+# and no ROLLBACK when the connection goes back to the pool
+ro_engine = create_async_engine(
+    settings.DATABASE_URL,
+    echo=settings.SQL_ECHO,
+    future=True,
+    isolation_level="AUTOCOMMIT",
+    skip_autocommit_rollback=True,
+    **ro_pool_options
+)
+
+ro_session_maker = async_sessionmaker(
+    ro_engine,
+    class_=AsyncSession,
+    expire_on_commit=False
+)
+
 Base = declarative_base()
 
 # Dependency to get DB session
@@ -26,6 +55,11 @@ async def get_db():
         finally:
             await session.close()
 
+# Dependency for read-only endpoints (no transaction wrapper)
+async def get_db_ro():
+    async with ro_session_maker() as session:
+        yield session
+
 # Initialize database
 async def init_db():
     async with engine.begin() as conn:
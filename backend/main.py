@@ -1,8 +1,10 @@
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
-from config import settings
+from typing import Dict
+from config import CORS_ORIGINS_TUPLE
 from database import init_db
+from middleware import GZipRequestMiddleware, PathExemptCORSMiddleware
 from routers import auth_router, blog_router
 
 @asynccontextmanager
@@ -19,21 +21,30 @@ app = FastAPI(
     lifespan=lifespan
 )
 
-# Configure CORS
+# Configure CORS; the root and health probes are never called cross-origin,
+# so they skip the middleware entirely. A frozenset makes origin checks O(1).
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins_list,
+    PathExemptCORSMiddleware,
+    exempt_paths=("/", "/health"),
+    allow_origins=frozenset(CORS_ORIGINS_TUPLE),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Accept gzip-compressed request bodies (used by create_blogs.py)
+app.add_middleware(GZipRequestMiddleware)
+
+# Compress responses (multi-KB article bodies) for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include routers
 app.include_router(auth_router.router)
 app.include_router(blog_router.router)
 
+# Return annotations let FastAPI serialize straight to JSON bytes via Pydantic
 @app.get("/")
-async def root():
+async def root() -> Dict[str, str]:
     return {
         "message": "Tushar's Blog API",
         "docs": "/docs",
@@ -41,9 +52,20 @@ async def root():
     }
 
 @app.get("/health")
-async def health_check():
+async def health_check() -> Dict[str, str]:
     return {"status": "healthy"}
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    from config import settings
+
+    # uvicorn picks uvloop/httptools automatically when installed; the file
+    # watcher (which cannot be combined with workers) is for development only
+    dev = settings.ENV == "dev"
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=dev,
+        workers=None if dev else max(1, settings.WORKERS)
+    )
@@ -0,0 +1,84 @@
+import zlib
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import PlainTextResponse
+
+class GZipRequestMiddleware:
+    """Inflate request bodies sent with Content-Encoding: gzip"""
+
+    def __init__(self, app, max_size: int = 10 * 1024 * 1024):
+        self.app = app
+        self.max_size = max_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not any(
+            name == b"content-encoding" and value.strip().lower() == b"gzip"
+            for name, value in scope["headers"]
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        # The compressed body is capped as well, so it cannot be buffered
+        # without bound before inflation starts
+        chunks = []
+        received = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            chunk = message.get("body", b"")
+            received += len(chunk)
+            if received > self.max_size:
+                await PlainTextResponse("Request body too large", status_code=413)(scope, receive, send)
+                return
+            chunks.append(chunk)
+            more_body = message.get("more_body", False)
+
+        # Cap the inflated size so a small compressed body cannot exhaust memory
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        try:
+            body = decompressor.decompress(b"".join(chunks), self.max_size)
+        except zlib.error:
+            await PlainTextResponse("Invalid gzip body", status_code=400)(scope, receive, send)
+            return
+        if decompressor.unconsumed_tail or (
+            not decompressor.eof and len(body) >= self.max_size
+        ):
+            await PlainTextResponse("Request body too large", status_code=413)(scope, receive, send)
+            return
+        # A truncated stream or bytes after the gzip member is not a valid body
+        if not decompressor.eof or decompressor.unused_data:
+            await PlainTextResponse("Invalid gzip body", status_code=400)(scope, receive, send)
+            return
+
+        headers = [
+            (name, value)
+            for name, value in scope["headers"]
+            if name not in (b"content-encoding", b"content-length")
+        ]
+        headers.append((b"content-length", str(len(body)).encode()))
+        scope = dict(scope, headers=headers)
+
+        body_sent = False
+
+        async def receive_inflated():
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        await self.app(scope, receive_inflated, send)
+
+class PathExemptCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware that passes exempt paths (e.g. health checks) straight through"""
+
+    def __init__(self, app, exempt_paths=(), **options):
+        super().__init__(app, **options)
+        self.exempt_paths = frozenset(exempt_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
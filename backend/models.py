@@ -1,7 +1,20 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Index, literal_column
+from sqlalchemy.dialects import postgresql  # noqa: F401 - registers the to_tsvector/plainto_tsquery types
 from sqlalchemy.sql import func
 from database import Base
 
+# PostgreSQL full-text search config; inlined constants (not bound
+# parameters) keep the query expression identical to the indexed one
+_SEARCH_CONFIG = literal_column("'english'::regconfig")
+
+def _search_vector(title, description, tags):
+    """tsvector document searched by blog_search_match"""
+    space = literal_column("' '")
+    return func.to_tsvector(
+        _SEARCH_CONFIG,
+        title + space + description + space + func.coalesce(tags, literal_column("''"))
+    )
+
 class Blog(Base):
     __tablename__ = "blogs"
 
@@ -18,9 +31,25 @@ class Blog(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
 
+    # The composite index lets the published listing walk in order and stop at
+    # LIMIT; the GIN index backs full-text search on PostgreSQL
+    __table_args__ = (
+        Index("ix_blogs_published_created_at", published, created_at.desc()),
+        Index(
+            "ix_blogs_search", _search_vector(title, description, tags), postgresql_using="gin"
+        ).ddl_if(dialect="postgresql"),
+    )
+
     def __repr__(self):
         return f"<Blog {self.title}>"
 
+def blog_search_match(q: str):
+    """Full-text match of q against the GIN-indexed blog document (PostgreSQL only)"""
+    blogs = Blog.__table__.c
+    return _search_vector(blogs.title, blogs.description, blogs.tags).op("@@")(
+        func.plainto_tsquery(_SEARCH_CONFIG, q)
+    )
+
 class Comment(Base):
     __tablename__ = "comments"
 
@@ -1,8 +1,6 @@
 from fastapi import APIRouter, HTTPException, status
-from datetime import timedelta
 from schemas import LoginRequest, TokenResponse
 from auth import verify_admin_credentials, create_access_token
-from config import settings
 
 router = APIRouter(prefix="/api/auth", tags=["Authentication"])
 
@@ -16,11 +14,7 @@ async def login(request: LoginRequest):
             detail="Invalid phone number or OTP",
         )
 
-    # Create access token
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": request.phone},
-        expires_delta=access_token_expires
-    )
+    # Create access token (expires after ACCESS_TOKEN_EXPIRE_MINUTES)
+    access_token = create_access_token(data={"sub": request.phone})
 
     return TokenResponse(access_token=access_token)
@@ -1,73 +1,131 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, update
+from sqlalchemy.orm import load_only
+from sqlalchemy import select, func, update, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from typing import List
 import re
-from database import get_db
-from models import Blog, Comment
-from schemas import BlogCreate, BlogUpdate, BlogResponse, CommentCreate, CommentResponse
+import secrets
+from database import async_session_maker, engine, get_db, get_db_ro
+from models import Blog, Comment, blog_search_match
+from schemas import BlogCreate, BlogBulkCreate, BlogUpdate, BlogResponse, BlogListItem, CommentCreate, CommentResponse
 from auth import get_current_admin, AdminInfo
+from cache import TTLCache
 
 router = APIRouter(prefix="/api/blogs", tags=["Blogs"])
 
+IS_POSTGRESQL = engine.dialect.name == "postgresql"
+
+# Dialect-specific INSERT so the unique slug index can arbitrate via ON CONFLICT
+insert = pg_insert if IS_POSTGRESQL else sqlite_insert
+
+def random_slug_suffix(base_slug: str) -> str:
+    """Disambiguate a taken slug; collisions on the suffix are vanishingly rare"""
+    return f"{base_slug}-{secrets.token_hex(3)}"
+
+# Plain column selects for read-only listings skip ORM instance construction
+# and the identity map; rows still validate via from_attributes. Listings
+# leave out content, which is only served for a single blog.
+BLOG_LIST_COLUMNS = tuple(getattr(Blog, name) for name in BlogListItem.model_fields)
+
+# Public blog reads by slug. The cache is per-process and only the worker
+# that handles a write evicts its entry, so other workers may keep serving
+# an edited, unpublished or deleted post until the TTL runs out; keep it
+# short (view counts in the body lag likewise)
+_blog_cache = TTLCache(maxsize=1024, ttl=5)
+
+# The hottest read path skips ORM statement compilation and row hydration.
+# A view is not an edit, so unlike an ORM update the counter leaves
+# updated_at alone.
+_BLOG_COLUMNS = tuple(Blog.__table__.columns)
+_SLUG_STMT = text(
+    f"SELECT {', '.join(column.name for column in _BLOG_COLUMNS)} FROM blogs "
+    "WHERE slug = :slug AND published = TRUE"
+).columns(*_BLOG_COLUMNS)
+_COUNT_VIEW_STMT = text("UPDATE blogs SET views = views + 1 WHERE id = :id")
+
+async def count_view(blog_id: int) -> None:
+    """Record one view after the response has been sent"""
+    async with async_session_maker() as session:
+        await session.execute(_COUNT_VIEW_STMT, {"id": blog_id})
+        await session.commit()
+
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
 def create_slug(title: str) -> str:
-    """Create URL-friendly slug from title"""
-    slug = title.lower()
-    slug = re.sub(r'[^a-z0-9]+', '-', slug)
-    slug = slug.strip('-')
-    return slug
+    """Create URL-friendly slug from title, falling back to "post" if nothing is left"""
+    return _SLUG_RE.sub('-', title.lower()).strip('-') or "post"
 
 # Public endpoints
-@router.get("", response_model=List[BlogResponse])
+@router.get("", response_model=List[BlogListItem])
 async def get_all_blogs(
-    skip: int = Query(0, ge=0),
-    limit: int = Query(10, ge=1, le=100),
+    skip: int = 0,
+    limit: int = 10,
     published_only: bool = True,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_ro)
 ):
     """Get all blogs (public - shows only published if not admin)"""
-    query = select(Blog)
+    # Clamp in Python rather than through Query(ge=..., le=...) constraints
+    skip = max(0, skip)
+    limit = max(1, min(limit, 100))
+    query = select(*BLOG_LIST_COLUMNS)
     if published_only:
         query = query.where(Blog.published == True)
     query = query.offset(skip).limit(limit).order_by(Blog.created_at.desc())
 
     result = await db.execute(query)
-    blogs = result.scalars().all()
-    return blogs
+    return result.all()
 
 @router.get("/slug/{slug}", response_model=BlogResponse)
-async def get_blog_by_slug(slug: str, db: AsyncSession = Depends(get_db)):
+async def get_blog_by_slug(
+    slug: str,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db_ro)
+):
     """Get a single blog by slug (public)"""
-    query = select(Blog).where(Blog.slug == slug, Blog.published == True)
-    result = await db.execute(query)
-    blog = result.scalar_one_or_none()
-
-    if not blog:
-        raise HTTPException(status_code=404, detail="Blog not found")
-
-    # Increment views
-    blog.views += 1
-    await db.commit()
-
+    # The view is counted once the response is out, so reads never wait on
+    # a write; the returned count therefore excludes the current view
+    blog = _blog_cache.get(slug)
+    if blog is None:
+        # A write that evicts while this read is in flight bumps the
+        # generation, so the possibly stale row is not cached
+        generation = _blog_cache.generation()
+        result = await db.execute(_SLUG_STMT, {"slug": slug})
+        row = result.first()
+
+        if row is None:
+            raise HTTPException(status_code=404, detail="Blog not found")
+
+        blog = BlogResponse.model_validate(row)
+        _blog_cache.set(slug, blog, generation=generation)
+
+    background_tasks.add_task(count_view, blog.id)
     return blog
 
-@router.get("/search", response_model=List[BlogResponse])
+@router.get("/search", response_model=List[BlogListItem])
 async def search_blogs(
     q: str = Query(..., min_length=1),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_ro)
 ):
     """Search blogs by title, description, or tags"""
-    search_term = f"%{q}%"
-    query = select(Blog).where(
+    if IS_POSTGRESQL:
+        # GIN-indexed full-text lookup instead of three unindexable scans
+        match = blog_search_match(q)
+    else:
+        # SQLite's LIKE is already case-insensitive for ASCII, exactly like
+        # its lower(); ilike would wrap every column in lower() per row
+        search_term = f"%{q}%"
+        match = (Blog.title.like(search_term) |
+                 Blog.description.like(search_term) |
+                 Blog.tags.like(search_term))
+    query = select(*BLOG_LIST_COLUMNS).where(
         Blog.published == True,
-        (Blog.title.ilike(search_term) |
-         Blog.description.ilike(search_term) |
-         Blog.tags.ilike(search_term))
+        match
     ).order_by(Blog.created_at.desc())
 
     result = await db.execute(query)
-    blogs = result.scalars().all()
-    return blogs
+    return result.all()
 
 # Admin endpoints
 @router.post("", response_model=BlogResponse, status_code=status.HTTP_201_CREATED)
@@ -77,31 +135,70 @@ async def create_blog(
     admin: AdminInfo = Depends(get_current_admin)
 ):
     """Create a new blog (admin only)"""
-    # Generate slug
+    # Generate slug; the unique index rejects a taken one in the same round trip
     base_slug = create_slug(blog_data.title)
     slug = base_slug
 
-    # Ensure slug is unique
-    counter = 1
     while True:
-        query = select(Blog).where(Blog.slug == slug)
+        query = (
+            insert(Blog)
+            .values(**blog_data.model_dump(), slug=slug)
+            .on_conflict_do_nothing(index_elements=[Blog.slug])
+            .returning(Blog)
+        )
         result = await db.execute(query)
-        existing = result.scalar_one_or_none()
-        if not existing:
+        blog = result.scalar_one_or_none()
+        if blog:
             break
-        slug = f"{base_slug}-{counter}"
-        counter += 1
+        slug = random_slug_suffix(base_slug)
 
-    # Create blog
-    blog = Blog(
-        **blog_data.model_dump(),
-        slug=slug
-    )
-    db.add(blog)
     await db.commit()
-    await db.refresh(blog)
     return blog
 
+@router.post("/bulk", response_model=List[BlogResponse], status_code=status.HTTP_201_CREATED)
+async def create_blogs_bulk(
+    bulk_data: BlogBulkCreate,
+    db: AsyncSession = Depends(get_db),
+    admin: AdminInfo = Depends(get_current_admin)
+):
+    """Create several blogs in a single transaction (admin only)"""
+    base_slugs = [create_slug(blog_data.title) for blog_data in bulk_data.blogs]
+
+    # Fetch the base slugs that are already taken in one query; a taken one
+    # gets the same random suffix as in create_blog
+    query = select(Blog.slug).where(Blog.slug.in_(set(base_slugs)))
+    result = await db.execute(query)
+    taken = set(result.scalars().all())
+
+    rows = []
+    for blog_data, base_slug in zip(bulk_data.blogs, base_slugs):
+        slug = base_slug
+        while slug in taken:
+            slug = random_slug_suffix(base_slug)
+        taken.add(slug)
+        rows.append(blog_data.model_dump() | {"slug": slug})
+
+    # One multi-row INSERT ... RETURNING instead of per-row inserts plus a
+    # reload. A concurrent create may take a slug after the check above, so
+    # the unique index skips those rows and they are retried with a new
+    # suffix. RETURNING order is unspecified (and asking SQLAlchemy to sort
+    # splits SQLite into one statement per row), so match rows up by slug.
+    query = (
+        insert(Blog)
+        .on_conflict_do_nothing(index_elements=[Blog.slug])
+        .returning(Blog)
+    )
+    created = {}
+    pending = list(zip(base_slugs, rows))
+    while pending:
+        result = await db.execute(query, [row for _, row in pending])
+        created.update((blog.slug, blog) for blog in result.scalars())
+        pending = [(base, row) for base, row in pending if row["slug"] not in created]
+        for base_slug, row in pending:
+            row["slug"] = random_slug_suffix(base_slug)
+    await db.commit()
+    return [created[row["slug"]] for row in rows]
+
 @router.get("/{blog_id}", response_model=BlogResponse)
 async def get_blog_by_id(
     blog_id: int,
@@ -139,22 +236,20 @@ async def update_blog(
     # If title is updated, regenerate slug
     if "title" in update_data:
         base_slug = create_slug(update_data["title"])
-        slug = base_slug
-        counter = 1
-        while True:
-            query = select(Blog).where(Blog.slug == slug, Blog.id != blog_id)
-            result = await db.execute(query)
-            existing = result.scalar_one_or_none()
-            if not existing:
-                break
-            slug = f"{base_slug}-{counter}"
-            counter += 1
-        update_data["slug"] = slug
+        query = select(Blog.id).where(Blog.slug == base_slug, Blog.id != blog_id).limit(1)
+        result = await db.execute(query)
+        if result.scalar_one_or_none() is None:
+            update_data["slug"] = base_slug
+        else:
+            update_data["slug"] = random_slug_suffix(base_slug)
 
+    old_slug = blog.slug
     for key, value in update_data.items():
         setattr(blog, key, value)
 
     await db.commit()
+    _blog_cache.pop(old_slug)
+    _blog_cache.pop(blog.slug)
     await db.refresh(blog)
     return blog
 
@@ -165,7 +260,8 @@ async def delete_blog(
     admin: AdminInfo = Depends(get_current_admin)
 ):
     """Delete a blog (admin only)"""
-    query = select(Blog).where(Blog.id == blog_id)
+    # Only the key and slug are needed; leave the content column unread
+    query = select(Blog).where(Blog.id == blog_id).options(load_only(Blog.id, Blog.slug))
     result = await db.execute(query)
     blog = result.scalar_one_or_none()
 
@@ -174,6 +270,7 @@ async def delete_blog(
 
     await db.delete(blog)
     await db.commit()
+    _blog_cache.pop(blog.slug)
 
 # Comments
 @router.post("/comments", response_model=CommentResponse, status_code=status.HTTP_201_CREATED)
@@ -183,11 +280,11 @@ async def create_comment(
 ):
     """Create a comment (public - requires approval)"""
     # Check if blog exists
-    query = select(Blog).where(Blog.id == comment_data.blog_id)
+    query = select(Blog.id).where(Blog.id == comment_data.blog_id)
     result = await db.execute(query)
-    blog = result.scalar_one_or_none()
+    blog_id = result.scalar_one_or_none()
 
-    if not blog:
+    if blog_id is None:
         raise HTTPException(status_code=404, detail="Blog not found")
 
     comment = Comment(**comment_data.model_dump())
@@ -200,7 +297,7 @@ async def create_comment(
 async def get_blog_comments(
     blog_id: int,
     approved_only: bool = True,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_ro)
 ):
     """Get comments for a blog"""
     query = select(Comment).where(Comment.blog_id == blog_id)
@@ -1,7 +1,15 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
 from typing import Optional, List
 
+def normalize_tags(tags: Optional[str]) -> Optional[str]:
+    """Trim and de-duplicate comma-separated tags at write time, keeping their case"""
+    if tags is None:
+        return None
+    seen = dict.fromkeys(tag.strip() for tag in tags.split(","))
+    seen.pop("", None)
+    return ",".join(seen)
+
 # Blog Schemas
 class BlogBase(BaseModel):
     title: str = Field(..., min_length=1, max_length=255)
@@ -12,7 +20,10 @@ class BlogBase(BaseModel):
     published: bool = True
 
 class BlogCreate(BlogBase):
-    pass
+    _normalize_tags = field_validator("tags")(normalize_tags)
+
+class BlogBulkCreate(BaseModel):
+    blogs: List[BlogCreate] = Field(..., min_length=1)
 
 class BlogUpdate(BaseModel):
     title: Optional[str] = Field(None, min_length=1, max_length=255)
@@ -22,6 +33,8 @@ class BlogUpdate(BaseModel):
     image_url: Optional[str] = None
     published: Optional[bool] = None
 
+    _normalize_tags = field_validator("tags")(normalize_tags)
+
 class BlogResponse(BlogBase):
     id: int
     slug: str
@@ -33,6 +46,23 @@ class BlogResponse(BlogBase):
     class Config:
         from_attributes = True
 
+class BlogListItem(BaseModel):
+    """Listing/search entry; omits content so article bodies are not shipped"""
+    id: int
+    slug: str
+    title: str
+    description: str
+    author: str
+    tags: str
+    image_url: Optional[str]
+    published: bool
+    views: int
+    created_at: datetime
+    updated_at: Optional[datetime]
+
+    class Config:
+        from_attributes = True
+
 # Comment Schemas
 class CommentBase(BaseModel):
     author_name: str = Field(..., min_length=1, max_length=100)
@@ -63,3 +93,6 @@ class TokenResponse(BaseModel):
 class AdminInfo(BaseModel):
     phone: str
     is_admin: bool = True
+
+    class Config:
+        frozen = True
@@ -0,0 +1,13 @@
+"""Test setup for the backend: import path and minimal required settings."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# config.Settings requires these; real values come from .env in deployments
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("ADMIN_PHONE", "0000000000")
+os.environ.setdefault("ADMIN_OTP", "000000")
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("CORS_ORIGINS", "http://localhost:3000")
@@ -0,0 +1,28 @@
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from auth import create_access_token, verify_token
+from config import settings
+
+
+def _token(**claims):
+    return create_access_token({"sub": settings.ADMIN_PHONE, **claims})
+
+
+def test_valid_token_verifies():
+    assert verify_token(_token())["sub"] == settings.ADMIN_PHONE
+
+
+@pytest.mark.parametrize("suffix", ["!!", "==", "A", "AAAA"])
+def test_altered_token_rejected(suffix):
+    with pytest.raises(HTTPException) as exc_info:
+        verify_token(_token() + suffix)
+    assert exc_info.value.status_code == 401
+
+
+def test_token_not_yet_valid_rejected():
+    with pytest.raises(HTTPException) as exc_info:
+        verify_token(_token(nbf=int(time.time()) + 3600))
+    assert exc_info.value.status_code == 401
@@ -0,0 +1,43 @@
+import gzip
+
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import Response
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from middleware import GZipRequestMiddleware
+
+
+async def echo(request):
+    return Response(await request.body())
+
+
+@pytest.fixture
+def client():
+    app = Starlette(routes=[Route("/", echo, methods=["POST"])])
+    app.add_middleware(GZipRequestMiddleware, max_size=1024)
+    return TestClient(app)
+
+
+def _post(client, body):
+    return client.post("/", content=body, headers={"Content-Encoding": "gzip"})
+
+
+def test_inflates_gzip_body(client):
+    response = _post(client, gzip.compress(b"hello"))
+    assert response.status_code == 200
+    assert response.content == b"hello"
+
+
+def test_truncated_gzip_rejected(client):
+    assert _post(client, gzip.compress(b"hello" * 20)[:-6]).status_code == 400
+
+
+def test_trailing_data_rejected(client):
+    assert _post(client, gzip.compress(b"hello") + b"junk").status_code == 400
+
+
+def test_oversized_bodies_rejected(client):
+    assert _post(client, gzip.compress(bytes(4096))).status_code == 413
+    assert _post(client, b"\x1f\x8b" + bytes(2048)).status_code == 413
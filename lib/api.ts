@@ -1,6 +1,6 @@
 // API client for blog backend
 
-import type { Blog, Comment, CommentCreate, LoginRequest, LoginResponse, BlogCreate, BlogUpdate } from './types';
+import type { Blog, BlogListItem, Comment, CommentCreate, LoginRequest, LoginResponse, BlogCreate, BlogUpdate } from './types';
 
 const API_BASE = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
 
@@ -45,17 +45,17 @@ class APIClient {
   }
 
   // Public Blog Endpoints
-  async getAllBlogs(): Promise<Blog[]> {
-    return this.request<Blog[]>('/api/blogs');
+  async getAllBlogs(): Promise<BlogListItem[]> {
+    return this.request<BlogListItem[]>('/api/blogs');
   }
 
   async getBlogBySlug(slug: string): Promise<Blog> {
     return this.request<Blog>(`/api/blogs/slug/${slug}`);
   }
 
-  async searchBlogs(query: string): Promise<Blog[]> {
+  async searchBlogs(query: string): Promise<BlogListItem[]> {
     const encodedQuery = encodeURIComponent(query);
-    return this.request<Blog[]>(`/api/blogs/search?q=${encodedQuery}`);
+    return this.request<BlogListItem[]>(`/api/blogs/search?q=${encodedQuery}`);
   }
 
   async getBlogComments(blogId: number): Promise<Comment[]> {
@@ -18,6 +18,9 @@ export interface Blog {
   readingTime?: string;
 }
 
+/** Entry returned by the listing and search endpoints, which omit the article body. */
+export type BlogListItem = Omit<Blog, 'content' | 'contentHtml' | 'readingTime'>;
+
 export interface Comment {
   id: number;
   blog_id: number;
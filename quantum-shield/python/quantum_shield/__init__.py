@@ -60,6 +60,9 @@ from .cipher import (
     CHACHA_TAG_SIZE,
     QSHIELD_KEY_SIZE,
     QSHIELD_OVERHEAD,
+    QSHIELD_SINGLE_OVERHEAD,
+    STREAM_CHUNK_SIZE,
+    aes_hardware_available,
 )
 
 # --- Hybrid KEM ---
@@ -115,6 +118,9 @@ __all__ = [
     "CHACHA_TAG_SIZE",
     "QSHIELD_KEY_SIZE",
     "QSHIELD_OVERHEAD",
+    "QSHIELD_SINGLE_OVERHEAD",
+    "STREAM_CHUNK_SIZE",
+    "aes_hardware_available",
     # KEM
     "QShieldKEM",
     "QShieldKEMPublicKey",
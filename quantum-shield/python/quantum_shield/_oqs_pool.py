@@ -0,0 +1,35 @@
+"""
+Lazy worker pool for liboqs calls.
+
+liboqs is called through ctypes, which drops the GIL, so on a multi-core
+host the ML-KEM or ML-DSA half of a hybrid operation runs on a worker thread
+while the caller does the X25519 or Ed25519 half. A single core gains
+nothing from the thread hop, so there the work runs inline.
+"""
+
+import os
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+if TYPE_CHECKING:  # concurrent.futures is only imported once a pool is needed
+    from concurrent.futures import Future
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def submit(fn: Callable[..., Any], *args: Any) -> Optional["Future"]:
+    """Start ``fn`` on the shared liboqs pool; ``None`` means run it inline."""
+    global _pool
+    if (os.cpu_count() or 1) < 2:
+        return None
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                from concurrent.futures import ThreadPoolExecutor
+
+                _pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="qshield-oqs")
+    try:
+        return _pool.submit(fn, *args)
+    except RuntimeError:  # pool shut down at interpreter exit
+        return None
@@ -9,12 +9,19 @@ Security Properties:
     - Different mathematical foundations (substitution-permutation vs ARX)
     - Independent keys derived from the master key via HKDF
     - Separate nonces for each layer
+
+Deployments that do not need the second layer can pass ``cascade=False`` for
+AES-256-GCM alone. On CPUs with AES instructions (see
+:func:`aes_hardware_available`) GCM is several times faster than ChaCha20,
+so the ChaCha layer dominates the cascade and dropping it roughly doubles
+throughput.
 """
 
+import functools
 import os
 import struct
-
-from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
+import weakref
+from typing import BinaryIO, List, Optional, Sequence, Tuple
 
 from .errors import (
     DecryptionError,
@@ -23,7 +30,13 @@ from .errors import (
     InvalidKeyError,
     QShieldError,
 )
-from .kdf import QShieldKDF
+from .kdf import QShieldKDF, _zeroize
+
+try:
+    # Optional Rust extension (the ``rust`` crate built with ``--features python``)
+    from ._native import NativeCascade as _NativeCascade
+except ImportError:
+    _NativeCascade = None
 
 # --- Constants matching the Rust SDK ---
 AES_KEY_SIZE = 32       # AES-256
@@ -38,12 +51,103 @@ QSHIELD_KEY_SIZE = AES_KEY_SIZE + CHACHA_KEY_SIZE  # 64 bytes total
 QSHIELD_OVERHEAD = (
     AES_NONCE_SIZE + AES_TAG_SIZE + CHACHA_NONCE_SIZE + CHACHA_TAG_SIZE
 )  # 56 bytes
+QSHIELD_SINGLE_OVERHEAD = AES_NONCE_SIZE + AES_TAG_SIZE  # 28 bytes, cascade=False
+
+# cryptography's AEAD module pulls in the whole ciphers package, which apps
+# importing quantum_shield only for the KEM or signatures never use, so it is
+# loaded by the first QuantumShield construction (see _load_aead)
+_aead = None
+
+# ``encrypt_into`` (cryptography >= 45) writes AEAD output into a caller
+# buffer. Its per-call overhead only pays off once the two concatenation
+# copies of a large payload dominate, so smaller messages keep ``encrypt``.
+# Both flags are filled in by _load_aead.
+_HAS_ENCRYPT_INTO = False
+_FUSED_MIN_SIZE = 64 * 1024
+_HAS_DECRYPT_INTO = False
+
+# Slicing a large ciphertext copies it; a memoryview slice does not, but
+# costs more than copying a few kilobytes
+_VIEW_MIN_SIZE = 16 * 1024
+
+# Streaming format: a header, then one frame per chunk with no per-frame
+# metadata. Every frame but the last carries exactly ``chunk_size`` bytes of
+# plaintext; the last is shorter (possibly empty), which marks the end.
+# Each stream seals under its own subkeys, derived from a random salt in the
+# header, so chunk counters can serve as nonces without colliding across
+# streams. The chunk size bound stops a forged header from forcing huge reads
+# before anything has been authenticated.
+STREAM_CHUNK_SIZE = 64 * 1024
+_STREAM_VERSION = 2
+_STREAM_SALT_SIZE = 32
+_STREAM_HEADER = struct.Struct(f">BI{_STREAM_SALT_SIZE}s")  # version, chunk size, salt
+_STREAM_NONCE = struct.Struct(">4xQ")  # zero padding || chunk counter
+_STREAM_MAX_CHUNK = 16 * STREAM_CHUNK_SIZE
+
+# QShieldKDF holds only its Argon2 config, which HKDF derivation never reads,
+# so a single instance is shared by every cipher setup and key rotation
+_DEFAULT_KDF = QShieldKDF()
+
+
+def _load_aead():
+    """Import and memoize cryptography's AEAD module."""
+    global _aead, _HAS_ENCRYPT_INTO, _HAS_DECRYPT_INTO
+    if _aead is None:
+        from cryptography.hazmat.primitives.ciphers import aead
+
+        _HAS_ENCRYPT_INTO = hasattr(aead.AESGCM, "encrypt_into") and hasattr(
+            aead.ChaCha20Poly1305, "encrypt_into"
+        )
+        _HAS_DECRYPT_INTO = hasattr(aead.AESGCM, "decrypt_into") and hasattr(
+            aead.ChaCha20Poly1305, "decrypt_into"
+        )
+        _aead = aead
+    return _aead
 
 
-def _zeroize(ba: bytearray) -> None:
-    """Overwrite a bytearray with zeros to erase secret material."""
-    for i in range(len(ba)):
-        ba[i] = 0
+@functools.lru_cache(maxsize=None)
+def aes_hardware_available() -> bool:
+    """Report whether the CPU advertises AES instructions.
+
+    Reads the ``aes`` flag (x86 AES-NI, ARMv8 Crypto Extensions) from
+    ``/proc/cpuinfo``. Returns ``False`` when it cannot tell, e.g. off Linux.
+    """
+    try:
+        with open("/proc/cpuinfo", encoding="ascii", errors="replace") as fh:
+            for line in fh:
+                key, _, value = line.partition(":")
+                if key.strip().lower() in ("flags", "features"):
+                    return "aes" in value.split()
+    except OSError:
+        pass
+    return False
+
+
+def _zeroize_keys(*keys: bytearray) -> None:
+    """Finalizer callback; must not reference the cipher it cleans up."""
+    for key in keys:
+        _zeroize(key)
+
+
+def _native_args(data: bytes, aad: Optional[bytes]) -> bool:
+    """The extension takes ``bytes`` only; other buffers use the Python path."""
+    return type(data) is bytes and (aad is None or type(aad) is bytes)
+
+
+def _read_exact(reader: BinaryIO, size: int) -> bytes:
+    """Read ``size`` bytes, looping over short reads; fewer only at EOF."""
+    data = reader.read(size)
+    if len(data) == size or not data:
+        return data
+    parts = [data]
+    remaining = size - len(data)
+    while remaining:
+        part = reader.read(remaining)
+        if not part:
+            break
+        parts.append(part)
+        remaining -= len(part)
+    return b"".join(parts)
 
 
 class QuantumShield:
@@ -51,7 +155,7 @@ class QuantumShield:
 
     Encrypts data first with AES-256-GCM, then with ChaCha20-Poly1305 for
     defense-in-depth. Keys for each layer are independently derived from the
-    shared secret using HKDF-SHA-256 with domain separation.
+    shared secret using HKDF-SHA-512 with domain separation.
 
     Example::
 
@@ -62,32 +166,90 @@ class QuantumShield:
     Args:
         shared_secret: Key material of any length (will be expanded via HKDF).
             Must not be empty.
+        cascade: When ``False``, encrypt with AES-256-GCM only, giving up the
+            second layer for speed. The wire format becomes
+            ``nonce (12B) || ciphertext || tag (16B)`` and is not
+            interchangeable with cascaded ciphertext.
+        siv: Use a single AES-256-GCM-SIV pass, trading the cascade's cipher
+            diversity for nonce-misuse resistance (a repeated nonce leaks only
+            message equality). Implies ``cascade=False`` and uses its own
+            derived key; same wire format and overhead as ``cascade=False``,
+            but not interchangeable with it. Needs OpenSSL 3.2+, whose
+            GCM-SIV is markedly slower than GCM, so measure before choosing
+            it for throughput.
 
     Raises:
         InvalidKeyError: If shared_secret is empty.
+        QShieldError: If ``siv`` is requested but the installed
+            cryptography/OpenSSL lacks AES-GCM-SIV.
     """
 
-    __slots__ = ("_aes_key", "_chacha_key", "_aes", "_chacha")
+    __slots__ = (
+        "_aes_key", "_chacha_key", "_aes", "_chacha", "_cascade", "_siv", "_min_len",
+        "_native",
+        "_finalizer", "__weakref__",
+    )
 
-    def __init__(self, shared_secret: bytes) -> None:
+    def __init__(
+        self, shared_secret: bytes, cascade: bool = True, siv: bool = False
+    ) -> None:
         if not shared_secret:
             raise InvalidKeyError("shared_secret must not be empty")
+        aead = _load_aead()
+        if siv and not hasattr(aead, "AESGCMSIV"):
+            raise QShieldError("AES-GCM-SIV requires cryptography >= 42")
 
         # Derive independent keys using HKDF with domain separation
         # This mirrors the Rust SDK: derive QSHIELD_KEY_SIZE bytes then split
-        kdf = QShieldKDF()
+        kdf = _DEFAULT_KDF
         derived = kdf.derive(
             ikm=shared_secret,
             salt=b"",  # Empty salt -- shared secret already has sufficient entropy
-            info=b"QuantumShield-cascade-v1",
-            length=QSHIELD_KEY_SIZE,
+            info=b"QuantumShield-siv-v1" if siv else b"QuantumShield-cascade-v1",
+            length=AES_KEY_SIZE if siv else QSHIELD_KEY_SIZE,
         )
 
-        self._aes_key = bytearray(derived[:AES_KEY_SIZE])
-        self._chacha_key = bytearray(derived[AES_KEY_SIZE:])
+        cascade = cascade and not siv
+        self._cascade = cascade
+        self._siv = siv
+        # Fixed per instance, so decrypt compares against a stored length
+        self._min_len = QSHIELD_OVERHEAD if cascade else QSHIELD_SINGLE_OVERHEAD
+        self._install_keys(derived)
 
-        self._aes = AESGCM(bytes(self._aes_key))
-        self._chacha = ChaCha20Poly1305(bytes(self._chacha_key))
+    def _install_keys(self, derived: bytes) -> None:
+        """Split derived key material into the per-layer keys and ciphers.
+
+        Each key is copied exactly once, into the bytearray kept for
+        zeroization; both AEAD constructors accept that buffer directly.
+        """
+        aead = _load_aead()
+        view = memoryview(derived)
+        self._aes_key = bytearray(view[:AES_KEY_SIZE])
+        self._chacha_key = bytearray(view[AES_KEY_SIZE:])
+        if self._siv:
+            # Single misuse-resistant layer; there is no ChaCha key
+            try:
+                self._aes = aead.AESGCMSIV(self._aes_key)
+            except Exception as exc:  # UnsupportedAlgorithm before OpenSSL 3.2
+                raise QShieldError(f"AES-GCM-SIV unavailable: {exc}") from exc
+            self._chacha = None
+        else:
+            # The AEAD objects keep their expanded key schedule between calls
+            # (cryptography >= 42), so a cached algorithms.AES plus a fresh
+            # Cipher(...).encryptor() per message is ~5x slower, not faster
+            self._aes = aead.AESGCM(self._aes_key)
+            self._chacha = aead.ChaCha20Poly1305(self._chacha_key)
+
+        # Wipes these keys when the cipher is collected (or at interpreter
+        # exit), without __del__'s teardown cost
+        self._finalizer = weakref.finalize(
+            self, _zeroize_keys, self._aes_key, self._chacha_key
+        )
+
+        # The extension seals or opens a whole cascade in one native call
+        self._native = None
+        if _NativeCascade is not None and self._cascade:
+            self._native = _NativeCascade(derived)
 
     # ------------------------------------------------------------------
     # Core encrypt / decrypt
@@ -111,17 +273,44 @@ class QuantumShield:
             EncryptionError: If encryption fails.
         """
         try:
-            # Layer 1: AES-256-GCM
+            return self._encrypt_layers(plaintext, None)
+        except Exception as exc:
+            raise EncryptionError(f"Cascading encryption failed: {exc}") from exc
+
+    def _encrypt_layers(self, plaintext: bytes, aad: Optional[bytes]) -> bytes:
+        """Encrypt with the AES layer, then (when cascading) the ChaCha20 layer."""
+        if self._native is not None and _native_args(plaintext, aad):
+            return self._native.encrypt(plaintext, aad)
+        if not self._cascade:
             aes_nonce = os.urandom(AES_NONCE_SIZE)
-            aes_ct = self._aes.encrypt(aes_nonce, plaintext, None)
-            aes_encrypted = aes_nonce + aes_ct
+            return aes_nonce + self._aes.encrypt(aes_nonce, plaintext, aad)
 
+        # Both nonces come from a single urandom call
+        nonces = os.urandom(CHACHA_NONCE_SIZE + AES_NONCE_SIZE)
+        chacha_nonce = nonces[:CHACHA_NONCE_SIZE]
+        aes_nonce = nonces[CHACHA_NONCE_SIZE:]
+
+        if not _HAS_ENCRYPT_INTO or len(plaintext) < _FUSED_MIN_SIZE:
+            # Layer 1: AES-256-GCM
+            aes_encrypted = aes_nonce + self._aes.encrypt(aes_nonce, plaintext, aad)
             # Layer 2: ChaCha20-Poly1305
-            chacha_nonce = os.urandom(CHACHA_NONCE_SIZE)
-            chacha_ct = self._chacha.encrypt(chacha_nonce, aes_encrypted, None)
-            return chacha_nonce + chacha_ct
-        except Exception as exc:
-            raise EncryptionError(f"Cascading encryption failed: {exc}") from exc
+            return chacha_nonce + self._chacha.encrypt(chacha_nonce, aes_encrypted, aad)
+
+        # Both layers land in one buffer laid out as the final wire format:
+        # chacha_nonce || aes_nonce || aes_ct || aes_tag || chacha_tag
+        inner_end = len(nonces) + len(plaintext) + AES_TAG_SIZE
+        out = bytearray(inner_end + CHACHA_TAG_SIZE)
+        out[:len(nonces)] = nonces
+        view = memoryview(out)
+
+        # Layer 1: AES-256-GCM, written straight after both nonces
+        self._aes.encrypt_into(aes_nonce, plaintext, aad, view[len(nonces):inner_end])
+        # Layer 2: ChaCha20-Poly1305, encrypting the inner layer in place
+        # (input and output start at the same address, which AEAD allows)
+        self._chacha.encrypt_into(
+            chacha_nonce, view[CHACHA_NONCE_SIZE:inner_end], aad, view[CHACHA_NONCE_SIZE:]
+        )
+        return bytes(out)
 
     def decrypt(self, ciphertext: bytes) -> bytes:
         """Decrypt cascaded ciphertext.
@@ -136,27 +325,36 @@ class QuantumShield:
             InvalidCiphertextError: If ciphertext is too short.
             DecryptionError: If authentication fails.
         """
-        min_len = CHACHA_NONCE_SIZE + CHACHA_TAG_SIZE + AES_NONCE_SIZE + AES_TAG_SIZE
-        if len(ciphertext) < min_len:
-            raise InvalidCiphertextError(
-                f"Ciphertext too short: {len(ciphertext)} bytes, need at least {min_len}"
-            )
+        if len(ciphertext) < self._min_len:
+            raise self._too_short(ciphertext)
 
         try:
-            # Strip ChaCha20 layer
-            chacha_nonce = ciphertext[:CHACHA_NONCE_SIZE]
-            chacha_ct = ciphertext[CHACHA_NONCE_SIZE:]
-            aes_encrypted = self._chacha.decrypt(chacha_nonce, chacha_ct, None)
-
-            # Strip AES layer
-            aes_nonce = aes_encrypted[:AES_NONCE_SIZE]
-            aes_ct = aes_encrypted[AES_NONCE_SIZE:]
-            return self._aes.decrypt(aes_nonce, aes_ct, None)
-        except (InvalidCiphertextError, QShieldError):
-            raise
+            return self._decrypt_layers(ciphertext, None)
         except Exception as exc:
             raise DecryptionError(f"Cascading decryption failed: {exc}") from exc
 
+    def _too_short(self, ciphertext: bytes) -> InvalidCiphertextError:
+        return InvalidCiphertextError(
+            f"Ciphertext too short: {len(ciphertext)} bytes, need at least {self._min_len}"
+        )
+
+    def _decrypt_layers(self, ciphertext: bytes, aad: Optional[bytes]) -> bytes:
+        """Strip the ChaCha20 layer (when cascading), then the AES layer."""
+        if self._native is not None and _native_args(ciphertext, aad):
+            return self._native.decrypt(ciphertext, aad)
+        if len(ciphertext) >= _VIEW_MIN_SIZE:
+            ciphertext = memoryview(ciphertext)
+        if self._cascade:
+            chacha_nonce = ciphertext[:CHACHA_NONCE_SIZE]
+            chacha_ct = ciphertext[CHACHA_NONCE_SIZE:]
+            ciphertext = self._chacha.decrypt(chacha_nonce, chacha_ct, aad)
+            if len(ciphertext) >= _VIEW_MIN_SIZE:
+                ciphertext = memoryview(ciphertext)
+
+        aes_nonce = ciphertext[:AES_NONCE_SIZE]
+        aes_ct = ciphertext[AES_NONCE_SIZE:]
+        return self._aes.decrypt(aes_nonce, aes_ct, aad)
+
     # ------------------------------------------------------------------
     # Encrypt / decrypt with additional authenticated data
     # ------------------------------------------------------------------
@@ -174,15 +372,7 @@ class QuantumShield:
             Cascaded ciphertext.
         """
         try:
-            # Layer 1: AES-256-GCM with AAD
-            aes_nonce = os.urandom(AES_NONCE_SIZE)
-            aes_ct = self._aes.encrypt(aes_nonce, plaintext, aad)
-            aes_encrypted = aes_nonce + aes_ct
-
-            # Layer 2: ChaCha20-Poly1305 with AAD
-            chacha_nonce = os.urandom(CHACHA_NONCE_SIZE)
-            chacha_ct = self._chacha.encrypt(chacha_nonce, aes_encrypted, aad)
-            return chacha_nonce + chacha_ct
+            return self._encrypt_layers(plaintext, aad)
         except Exception as exc:
             raise EncryptionError(f"Cascading encryption (AAD) failed: {exc}") from exc
 
@@ -196,27 +386,394 @@ class QuantumShield:
         Returns:
             Decrypted plaintext.
         """
-        min_len = CHACHA_NONCE_SIZE + CHACHA_TAG_SIZE + AES_NONCE_SIZE + AES_TAG_SIZE
-        if len(ciphertext) < min_len:
-            raise InvalidCiphertextError(
-                f"Ciphertext too short: {len(ciphertext)} bytes, need at least {min_len}"
-            )
+        if len(ciphertext) < self._min_len:
+            raise self._too_short(ciphertext)
 
         try:
-            chacha_nonce = ciphertext[:CHACHA_NONCE_SIZE]
-            chacha_ct = ciphertext[CHACHA_NONCE_SIZE:]
-            aes_encrypted = self._chacha.decrypt(chacha_nonce, chacha_ct, aad)
-
-            aes_nonce = aes_encrypted[:AES_NONCE_SIZE]
-            aes_ct = aes_encrypted[AES_NONCE_SIZE:]
-            return self._aes.decrypt(aes_nonce, aes_ct, aad)
-        except (InvalidCiphertextError, QShieldError):
-            raise
+            return self._decrypt_layers(ciphertext, aad)
         except Exception as exc:
             raise DecryptionError(
                 f"Cascading decryption (AAD) failed: {exc}"
             ) from exc
 
+    def decrypt_into(
+        self, out: bytearray, ciphertext: bytes, aad: Optional[bytes] = None
+    ) -> int:
+        """Decrypt into a caller-supplied buffer instead of a new ``bytes``.
+
+        Lets callers reuse one buffer across large messages rather than
+        allocating a fresh plaintext object per call.
+
+        Args:
+            out: Writable buffer of at least ``len(ciphertext) - overhead``
+                bytes; the plaintext is written to its start.
+            ciphertext: Ciphertext produced by :meth:`encrypt` or
+                :meth:`encrypt_with_aad`.
+            aad: Additional authenticated data, if any was used.
+
+        Returns:
+            Number of plaintext bytes written.
+
+        Raises:
+            InvalidCiphertextError: If ciphertext is too short.
+            DecryptionError: If ``out`` is too small or authentication fails;
+                in the latter case the written region of ``out`` is zeroed.
+        """
+        if len(ciphertext) < self._min_len:
+            raise self._too_short(ciphertext)
+        size = len(ciphertext) - self._min_len
+        if len(out) < size:
+            raise DecryptionError(
+                f"Output buffer too small: {len(out)} bytes, need {size}"
+            )
+
+        target = memoryview(out)[:size]
+        try:
+            if not _HAS_DECRYPT_INTO:
+                target[:] = self._decrypt_layers(ciphertext, aad)
+                return size
+
+            view = memoryview(ciphertext)
+            if self._cascade:
+                # The inner layer is still AES ciphertext, so only this
+                # scratch buffer is allocated
+                inner = bytearray(len(view) - CHACHA_NONCE_SIZE - CHACHA_TAG_SIZE)
+                self._chacha.decrypt_into(
+                    view[:CHACHA_NONCE_SIZE], view[CHACHA_NONCE_SIZE:], aad, inner
+                )
+                view = memoryview(inner)
+            self._aes.decrypt_into(
+                view[:AES_NONCE_SIZE], view[AES_NONCE_SIZE:], aad, target
+            )
+            return size
+        except Exception as exc:
+            # decrypt_into writes before verifying the tag; never leave
+            # unauthenticated plaintext behind
+            target[:] = bytes(size)
+            raise DecryptionError(f"Cascading decryption failed: {exc}") from exc
+
+    # ------------------------------------------------------------------
+    # Batch encryption
+    # ------------------------------------------------------------------
+
+    def encrypt_many(
+        self,
+        plaintexts: Sequence[bytes],
+        aads: Optional[Sequence[Optional[bytes]]] = None,
+    ) -> List[bytes]:
+        """Encrypt a batch of messages.
+
+        Equivalent to calling :meth:`encrypt` (or :meth:`encrypt_with_aad`)
+        per message, but the nonces for the whole batch come from one
+        ``os.urandom`` call and the per-message method lookups and exception
+        setup are paid once, which dominates the cost for small messages.
+
+        Args:
+            plaintexts: Messages to encrypt.
+            aads: Optional per-message additional authenticated data, the same
+                length as ``plaintexts``. ``None`` entries mean no AAD.
+
+        Returns:
+            Ciphertexts in the same order as ``plaintexts``.
+
+        Raises:
+            EncryptionError: If ``aads`` does not match ``plaintexts`` in
+                length, or encryption fails.
+        """
+        if aads is None:
+            aads = (None,) * len(plaintexts)
+        elif len(aads) != len(plaintexts):
+            raise EncryptionError(
+                f"Got {len(aads)} AADs for {len(plaintexts)} plaintexts"
+            )
+
+        aes_encrypt = self._aes.encrypt
+        out: List[bytes] = []
+        append = out.append
+        try:
+            if not self._cascade:
+                nonces = os.urandom(AES_NONCE_SIZE * len(plaintexts))
+                for i, (plaintext, aad) in enumerate(zip(plaintexts, aads)):
+                    aes_nonce = nonces[i * AES_NONCE_SIZE : (i + 1) * AES_NONCE_SIZE]
+                    append(aes_nonce + aes_encrypt(aes_nonce, plaintext, aad))
+                return out
+
+            chacha_encrypt = self._chacha.encrypt
+            stride = CHACHA_NONCE_SIZE + AES_NONCE_SIZE
+            nonces = os.urandom(stride * len(plaintexts))
+            for i, (plaintext, aad) in enumerate(zip(plaintexts, aads)):
+                offset = i * stride
+                chacha_nonce = nonces[offset : offset + CHACHA_NONCE_SIZE]
+                aes_nonce = nonces[offset + CHACHA_NONCE_SIZE : offset + stride]
+                aes_encrypted = aes_nonce + aes_encrypt(aes_nonce, plaintext, aad)
+                append(chacha_nonce + chacha_encrypt(chacha_nonce, aes_encrypted, aad))
+            return out
+        except Exception as exc:
+            raise EncryptionError(f"Batch encryption failed: {exc}") from exc
+
+    def decrypt_many(
+        self,
+        ciphertexts: Sequence[bytes],
+        aads: Optional[Sequence[Optional[bytes]]] = None,
+    ) -> List[bytes]:
+        """Decrypt a batch of messages produced by :meth:`encrypt_many`.
+
+        Equivalent to calling :meth:`decrypt` (or :meth:`decrypt_with_aad`)
+        per message; the whole batch fails if any message does. Every
+        ciphertext is length-checked before any decryption starts.
+
+        Args:
+            ciphertexts: Ciphertexts to decrypt.
+            aads: Optional per-message additional authenticated data, as for
+                :meth:`encrypt_many`.
+
+        Returns:
+            Plaintexts in the same order as ``ciphertexts``.
+
+        Raises:
+            InvalidCiphertextError: If a ciphertext is too short.
+            DecryptionError: If ``aads`` does not match ``ciphertexts`` in
+                length, or any message fails authentication.
+        """
+        if aads is None:
+            aads = (None,) * len(ciphertexts)
+        elif len(aads) != len(ciphertexts):
+            raise DecryptionError(
+                f"Got {len(aads)} AADs for {len(ciphertexts)} ciphertexts"
+            )
+
+        min_len = self._min_len
+        for ciphertext in ciphertexts:
+            if len(ciphertext) < min_len:
+                raise self._too_short(ciphertext)
+
+        decrypt_layers = self._decrypt_layers
+        try:
+            return [decrypt_layers(ct, aad) for ct, aad in zip(ciphertexts, aads)]
+        except Exception as exc:
+            raise DecryptionError(f"Batch decryption failed: {exc}") from exc
+
+    def encrypt_many_parallel(
+        self,
+        plaintexts: Sequence[bytes],
+        aads: Optional[Sequence[Optional[bytes]]] = None,
+        workers: Optional[int] = None,
+    ) -> List[bytes]:
+        """Encrypt a batch of messages on a thread pool.
+
+        The batch is cut into one contiguous slice per worker and each slice
+        goes through :meth:`encrypt_many`, so output order matches input
+        order and every message still gets fresh random nonces. This only
+        pays off on multi-core hosts with a ``cryptography`` build whose AEAD
+        calls release the GIL, and only for large messages; with one worker
+        (the default on a single-CPU host) it is plain :meth:`encrypt_many`.
+
+        Args:
+            plaintexts: Messages to encrypt.
+            aads: Optional per-message additional authenticated data, as for
+                :meth:`encrypt_many`.
+            workers: Number of threads. Defaults to ``os.cpu_count()``.
+
+        Returns:
+            Ciphertexts in the same order as ``plaintexts``.
+
+        Raises:
+            EncryptionError: If ``aads`` does not match ``plaintexts`` in
+                length, ``workers`` is not positive, or encryption fails.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        elif workers < 1:
+            raise EncryptionError(f"workers must be positive, got {workers}")
+        if aads is not None and len(aads) != len(plaintexts):
+            raise EncryptionError(
+                f"Got {len(aads)} AADs for {len(plaintexts)} plaintexts"
+            )
+
+        workers = min(workers, len(plaintexts))
+        if workers <= 1:
+            return self.encrypt_many(plaintexts, aads)
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        step = -(-len(plaintexts) // workers)
+        bounds = range(0, len(plaintexts), step)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(
+                    self.encrypt_many,
+                    plaintexts[start : start + step],
+                    None if aads is None else aads[start : start + step],
+                )
+                for start in bounds
+            ]
+            out: List[bytes] = []
+            for future in futures:
+                out.extend(future.result())
+        return out
+
+    # ------------------------------------------------------------------
+    # Streaming
+    # ------------------------------------------------------------------
+
+    def encrypt_stream(
+        self,
+        reader: BinaryIO,
+        writer: BinaryIO,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> int:
+        """Encrypt everything readable from ``reader`` into ``writer``.
+
+        Memory use is bounded by ``chunk_size`` rather than the payload size.
+        Each stream derives fresh layer keys via HKDF from the cipher's keys
+        and a random salt, and each chunk is sealed under those keys with the
+        chunk counter as nonce, so chunks cannot be reordered and nonces never
+        repeat under a key. The header and an end-of-stream flag are
+        authenticated with every chunk, so truncating or extending the stream
+        is detected.
+
+        Stream format::
+
+            version (1B) || chunk_size (4B) || salt (32B)
+            || frame*   where frame = layered ciphertext of one chunk, nonces implied
+
+        Args:
+            reader: Binary file-like object with ``read``.
+            writer: Binary file-like object with ``write``.
+            chunk_size: Plaintext bytes per frame.
+
+        Returns:
+            Number of plaintext bytes encrypted.
+
+        Raises:
+            EncryptionError: If ``chunk_size`` is out of range or encryption fails.
+        """
+        if not 0 < chunk_size <= _STREAM_MAX_CHUNK:
+            raise EncryptionError(f"Invalid stream chunk size: {chunk_size}")
+
+        header = _STREAM_HEADER.pack(
+            _STREAM_VERSION, chunk_size, os.urandom(_STREAM_SALT_SIZE)
+        )
+        writer.write(header)
+
+        total = 0
+        counter = 0
+        try:
+            layers = self._stream_layers(header)
+            chunk = _read_exact(reader, chunk_size)
+            while True:
+                # Read one chunk ahead: a short chunk is the final one, and a
+                # full chunk followed by EOF is followed by an empty final frame
+                final = len(chunk) < chunk_size
+                next_chunk = b"" if final else _read_exact(reader, chunk_size)
+                writer.write(self._seal_chunk(layers, header, counter, chunk, final))
+                total += len(chunk)
+                if final:
+                    return total
+                chunk = next_chunk
+                counter += 1
+        except Exception as exc:
+            raise EncryptionError(f"Stream encryption failed: {exc}") from exc
+
+    def decrypt_stream(self, reader: BinaryIO, writer: BinaryIO) -> int:
+        """Decrypt a stream produced by :meth:`encrypt_stream`.
+
+        Each chunk is authenticated before its plaintext is written, but a
+        stream that fails part-way leaves the already verified chunks in
+        ``writer``; discard its contents when this raises.
+
+        Args:
+            reader: Binary file-like object with ``read``.
+            writer: Binary file-like object with ``write``.
+
+        Returns:
+            Number of plaintext bytes written.
+
+        Raises:
+            InvalidCiphertextError: If the header is malformed or the stream
+                is truncated or has trailing data.
+            DecryptionError: If a chunk fails authentication.
+        """
+        header = _read_exact(reader, _STREAM_HEADER.size)
+        if len(header) < _STREAM_HEADER.size:
+            raise InvalidCiphertextError("Stream header truncated")
+        version, chunk_size, _ = _STREAM_HEADER.unpack(header)
+        if version != _STREAM_VERSION or not 0 < chunk_size <= _STREAM_MAX_CHUNK:
+            raise InvalidCiphertextError("Unsupported stream header")
+        layers = self._stream_layers(header)
+
+        tag_size = AES_TAG_SIZE + (CHACHA_TAG_SIZE if self._cascade else 0)
+        frame_size = chunk_size + tag_size
+
+        total = 0
+        counter = 0
+        while True:
+            frame = _read_exact(reader, frame_size)
+            final = len(frame) < frame_size
+            if final and len(frame) < tag_size:
+                raise InvalidCiphertextError("Stream truncated")
+            try:
+                chunk = self._open_chunk(layers, header, counter, frame, final)
+            except Exception as exc:
+                raise DecryptionError(f"Stream decryption failed: {exc}") from exc
+            writer.write(chunk)
+            total += len(chunk)
+            if final:
+                if reader.read(1):
+                    raise InvalidCiphertextError("Trailing data after stream end")
+                return total
+            counter += 1
+
+    def _stream_layers(self, header: bytes) -> Tuple[object, object]:
+        """Build the per-stream AEADs from subkeys bound to the header's salt.
+
+        The layers mirror the instance's (AES-GCM or GCM-SIV, plus ChaCha
+        when cascading); the subkey buffer is wiped once both have copied it.
+        """
+        _, _, salt = _STREAM_HEADER.unpack(header)
+        master = self._aes_key + self._chacha_key
+        subkeys = bytearray(
+            _DEFAULT_KDF.derive(
+                ikm=master,
+                salt=salt,
+                info=b"QuantumShield-stream-v2",
+                length=QSHIELD_KEY_SIZE if self._cascade else AES_KEY_SIZE,
+            )
+        )
+        _zeroize(master)
+        try:
+            with memoryview(subkeys) as view:
+                aes = type(self._aes)(view[:AES_KEY_SIZE])
+                chacha = (
+                    type(self._chacha)(view[AES_KEY_SIZE:]) if self._cascade else None
+                )
+        finally:
+            _zeroize(subkeys)
+        return aes, chacha
+
+    @staticmethod
+    def _seal_chunk(
+        layers: Tuple[object, object], header: bytes, counter: int, chunk: bytes, final: bool
+    ) -> bytes:
+        aes, chacha = layers
+        nonce = _STREAM_NONCE.pack(counter)
+        aad = header + (b"\x01" if final else b"\x00")
+        sealed = aes.encrypt(nonce, chunk, aad)
+        if chacha is not None:
+            sealed = chacha.encrypt(nonce, sealed, aad)
+        return sealed
+
+    @staticmethod
+    def _open_chunk(
+        layers: Tuple[object, object], header: bytes, counter: int, frame: bytes, final: bool
+    ) -> bytes:
+        aes, chacha = layers
+        nonce = _STREAM_NONCE.pack(counter)
+        aad = header + (b"\x01" if final else b"\x00")
+        if chacha is not None:
+            frame = chacha.decrypt(nonce, frame, aad)
+        return aes.decrypt(nonce, frame, aad)
+
     # ------------------------------------------------------------------
     # Convenience wrappers matching Rust SDK
     # ------------------------------------------------------------------
@@ -234,6 +791,15 @@ class QuantumShield:
         """Return the encryption overhead in bytes (nonce + tag for each layer)."""
         return QSHIELD_OVERHEAD
 
+    def message_overhead(self) -> int:
+        """Return the bytes this cipher adds to each message.
+
+        ``QSHIELD_OVERHEAD`` for the cascade, ``QSHIELD_SINGLE_OVERHEAD`` for
+        ``cascade=False`` and ``siv=True``; :meth:`overhead` always reports
+        the cascade's.
+        """
+        return self._min_len
+
     # ------------------------------------------------------------------
     # Key rotation (forward secrecy)
     # ------------------------------------------------------------------
@@ -245,37 +811,21 @@ class QuantumShield:
         After rotation, ciphertexts produced with the old keys can no longer be
         decrypted.
         """
-        kdf = QShieldKDF()
+        kdf = _DEFAULT_KDF
 
         # Build current key material
-        current = bytearray(bytes(self._aes_key) + bytes(self._chacha_key))
+        current = self._aes_key + self._chacha_key
 
         new_derived = kdf.derive(
-            ikm=bytes(current),
+            ikm=current,
             salt=None,
             info=b"QuantumShield-rotate-v1",
-            length=QSHIELD_KEY_SIZE,
+            length=len(current),
         )
 
-        # Zeroize old keys
+        # Zeroize old keys; calling the finalizer also retires it
         _zeroize(current)
-        _zeroize(self._aes_key)
-        _zeroize(self._chacha_key)
+        self._finalizer()
 
         # Install new keys
-        self._aes_key = bytearray(new_derived[:AES_KEY_SIZE])
-        self._chacha_key = bytearray(new_derived[AES_KEY_SIZE:])
-        self._aes = AESGCM(bytes(self._aes_key))
-        self._chacha = ChaCha20Poly1305(bytes(self._chacha_key))
-
-    # ------------------------------------------------------------------
-    # Cleanup
-    # ------------------------------------------------------------------
-
-    def __del__(self) -> None:
-        """Best-effort zeroization of key material on garbage collection."""
-        try:
-            _zeroize(self._aes_key)
-            _zeroize(self._chacha_key)
-        except Exception:
-            pass
+        self._install_keys(new_derived)
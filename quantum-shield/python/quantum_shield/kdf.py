@@ -2,7 +2,7 @@
 QShieldKDF - Quantum-resistant Key Derivation Function.
 
 Provides:
-    - HKDF-SHA-256 for key material combination (using ``cryptography`` library)
+    - HKDF-SHA-512 for key material combination (using ``cryptography`` library)
     - Argon2id for password-based key derivation (using ``argon2-cffi``)
     - Quantum-resistant salt generation
     - Domain separation for different use cases
@@ -16,10 +16,11 @@ Note:
 
 import hashlib
 import os
+import struct
 from dataclasses import dataclass, field
 from typing import List, Optional, Sequence
 
-from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives import hashes, hmac
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 
 from .errors import InvalidKeyError, KeyDerivationError
@@ -46,6 +47,75 @@ DOMAIN_HANDSHAKE = b"QShieldHandshake-v1"
 DOMAIN_SESSION = b"QShieldSession-v1"
 DOMAIN_PASSWORD = b"QShieldPassword-v1"
 
+# ---------------------------------------------------------------------------
+# Fixed-salt HKDF-SHA-512 fast path
+# ---------------------------------------------------------------------------
+# With an empty salt HKDF-Extract is keyed with 64 zero bytes, so its HMAC key
+# schedule is the same for every call; copying a pre-keyed HMAC skips both
+# that and the HKDF object construction (~25% of a 64-byte derive). The
+# post-Argon2id step always salts with DOMAIN_PASSWORD, so it gets the same.
+_SHA512 = hashes.SHA512()  # stateless descriptor, shared by every HMAC/HKDF
+_SHA512_SIZE = _SHA512.digest_size
+_HKDF_MAX_BLOCKS = 255
+_ZERO_SALT_HMAC = hmac.HMAC(bytes(_SHA512_SIZE), _SHA512)
+_PASSWORD_SALT_HMAC = hmac.HMAC(DOMAIN_PASSWORD, _SHA512)
+
+# combine() input framing: little-endian length prefixes plus a key count
+_U32 = struct.Struct("<I")
+_COMBINE_ONE_32 = struct.Struct("<I32sI")
+_COMBINE_PAIR_32 = struct.Struct("<I32sI32sI")
+
+# Copying an empty SHAKE-256 state is cheaper than constructing a new one
+_SHAKE_256 = hashlib.shake_256()
+
+
+def _hkdf_expand(prk: hmac.HMAC, info: bytes, length: int) -> bytes:
+    """RFC 5869 HKDF-Expand from an HMAC keyed with the PRK.
+
+    ``prk`` is only ever copied, so one keyed HMAC serves several expansions.
+    """
+    if length <= _SHA512_SIZE:
+        step = prk.copy()
+        step.update(info + b"\x01")
+        return step.finalize()[:length]
+
+    blocks = []
+    block = b""
+    for counter in range(1, -(-length // _SHA512_SIZE) + 1):
+        step = prk.copy()
+        step.update(block + info + bytes((counter,)))
+        block = step.finalize()
+        blocks.append(block)
+    return b"".join(blocks)[:length]
+
+
+def _hkdf_fixed_salt(
+    salt_hmac: hmac.HMAC, ikm: bytes, info: bytes, length: int
+) -> bytes:
+    """RFC 5869 HKDF-SHA-512 with a salt pre-keyed into ``salt_hmac``."""
+    extract = salt_hmac.copy()
+    extract.update(ikm)
+    prk = hmac.HMAC(extract.finalize(), _SHA512)
+    if length <= _SHA512_SIZE:
+        # Nothing else expands from this PRK, so skip the copy
+        prk.update(info + b"\x01")
+        return prk.finalize()[:length]
+    return _hkdf_expand(prk, info, length)
+
+
+def _zeroize(ba: bytearray) -> None:
+    """Overwrite a bytearray with zeros to erase secret material.
+
+    Uses a single ``memset`` over the buffer instead of a per-byte Python loop.
+    """
+    size = len(ba)
+    if size:
+        # Deferred: ctypes adds ~1.5 ms to every ``import quantum_shield``
+        # but is only needed once a key is actually wiped
+        import ctypes
+
+        ctypes.memset((ctypes.c_char * size).from_buffer(ba), 0, size)
+
 
 @dataclass
 class KdfConfig:
@@ -71,6 +141,25 @@ class KdfConfig:
         """Return a low-memory configuration for constrained environments."""
         return cls(memory_cost=16384, time_cost=4, parallelism=2)
 
+    @classmethod
+    def host_tuned(
+        cls, memory_cost: int = 262144, time_cost: int = 3
+    ) -> "KdfConfig":
+        """Return a configuration with one Argon2 lane per CPU core (at most 8).
+
+        libargon2 fills each lane on its own thread, so matching lanes to
+        cores shortens wall-clock time at the same memory hardness. The
+        lane count is part of the Argon2 output: a key derived with this
+        preset can only be re-derived with the same ``parallelism``, so
+        store the config next to the salt rather than recomputing it on a
+        different host. The fixed presets above never change.
+        """
+        return cls(
+            memory_cost=memory_cost,
+            time_cost=time_cost,
+            parallelism=max(1, min(os.cpu_count() or 1, 8)),
+        )
+
 
 class DerivedKey:
     """Derived key material with best-effort zeroization.
@@ -96,7 +185,10 @@ class DerivedKey:
         return bytes(self._key)
 
     def __getitem__(self, index):
-        return bytes(self._key)[index]
+        if isinstance(index, slice):
+            # Copy only the requested bytes, not the whole key
+            return bytes(memoryview(self._key)[index])
+        return self._key[index]
 
     # --- splitting --------------------------------------------------------
 
@@ -113,17 +205,18 @@ class DerivedKey:
             )
         keys: List[DerivedKey] = []
         offset = 0
-        for size in sizes:
-            keys.append(DerivedKey(bytes(self._key[offset : offset + size])))
-            offset += size
+        # Each piece is copied once, from the view straight into its bytearray
+        with memoryview(self._key) as view:
+            for size in sizes:
+                keys.append(DerivedKey(view[offset : offset + size]))
+                offset += size
         return keys
 
     # --- cleanup ----------------------------------------------------------
 
     def zeroize(self) -> None:
         """Explicitly overwrite key material with zeros."""
-        for i in range(len(self._key)):
-            self._key[i] = 0
+        _zeroize(self._key)
 
     def __del__(self) -> None:
         try:
@@ -155,8 +248,9 @@ class QShieldKDF:
         salt: Optional[bytes],
         info: bytes,
         length: int,
+        algorithm: Optional[hashes.HashAlgorithm] = None,
     ) -> bytes:
-        """Derive key material using HKDF-SHA-512.
+        """Derive key material using HKDF (SHA-512 by default).
 
         Args:
             ikm: Input keying material.
@@ -164,6 +258,9 @@ class QShieldKDF:
                   Pass ``b""`` for deterministic derivation.
             info: Context / domain separation string.
             length: Desired output length in bytes.
+            algorithm: HKDF hash. Defaults to ``hashes.SHA512()``; pass
+                ``hashes.SHA256()`` for new key schedules on hosts with SHA-NI.
+                Changing it changes the derived keys.
 
         Returns:
             Derived key bytes.
@@ -173,10 +270,19 @@ class QShieldKDF:
         """
         if salt is None:
             salt = os.urandom(64)
+        elif (
+            not salt
+            and algorithm is None
+            and 0 < length <= _HKDF_MAX_BLOCKS * _SHA512_SIZE
+        ):
+            try:
+                return _hkdf_fixed_salt(_ZERO_SALT_HMAC, ikm, info, length)
+            except Exception as exc:
+                raise KeyDerivationError(f"HKDF derivation failed: {exc}") from exc
 
         try:
             hkdf = HKDF(
-                algorithm=hashes.SHA512(),
+                algorithm=algorithm or _SHA512,
                 length=length,
                 salt=salt if salt else None,
                 info=info,
@@ -185,6 +291,105 @@ class QShieldKDF:
         except Exception as exc:
             raise KeyDerivationError(f"HKDF derivation failed: {exc}") from exc
 
+    def derive_many(
+        self,
+        ikm: bytes,
+        salt: Optional[bytes],
+        infos: Sequence[bytes],
+        lengths: Sequence[int],
+    ) -> List[bytes]:
+        """Derive several subkeys from a single HKDF-Extract.
+
+        Each output equals ``derive(ikm, salt, info, length)`` with the same
+        salt, but the Extract step and the PRK's HMAC key schedule are
+        computed once for the whole batch rather than once per subkey.
+
+        Args:
+            ikm: Input keying material.
+            salt: As for :meth:`derive`. A generated salt is shared by every
+                subkey in the batch.
+            infos: Context / domain separation string for each subkey.
+            lengths: Output length in bytes for each subkey.
+
+        Returns:
+            Derived key bytes, one per ``(info, length)`` pair.
+
+        Raises:
+            KeyDerivationError: If ``infos`` and ``lengths`` differ in length,
+                a length is out of range, or derivation fails.
+        """
+        if len(infos) != len(lengths):
+            raise KeyDerivationError(
+                f"Got {len(infos)} infos for {len(lengths)} lengths"
+            )
+        for length in lengths:
+            if not 0 < length <= _HKDF_MAX_BLOCKS * _SHA512_SIZE:
+                raise KeyDerivationError(f"Invalid HKDF output length: {length}")
+        if salt is None:
+            salt = os.urandom(64)
+
+        try:
+            if salt:
+                extract = hmac.HMAC(salt, _SHA512)
+            else:
+                extract = _ZERO_SALT_HMAC.copy()
+            extract.update(ikm)
+            prk = hmac.HMAC(extract.finalize(), _SHA512)
+            return [
+                _hkdf_expand(prk, info, length)
+                for info, length in zip(infos, lengths)
+            ]
+        except Exception as exc:
+            raise KeyDerivationError(f"HKDF derivation failed: {exc}") from exc
+
+    def derive_batch(
+        self,
+        ikms: Sequence[bytes],
+        salts: Sequence[Optional[bytes]],
+        infos: Sequence[bytes],
+        length: int,
+    ) -> List[bytes]:
+        """Derive one key per input; each output equals :meth:`derive`.
+
+        Servers deriving many session keys usually share a handful of salts,
+        so the salt's HMAC key schedule is computed once per distinct salt
+        and copied for every input that uses it.
+
+        Args:
+            ikms: Input keying material for each key.
+            salts: Salt for each key, as for :meth:`derive`; ``None`` entries
+                get their own random salt.
+            infos: Context / domain separation string for each key.
+            length: Output length in bytes, shared by the batch.
+
+        Returns:
+            Derived key bytes, one per input.
+
+        Raises:
+            KeyDerivationError: If the sequences differ in length, ``length``
+                is out of range, or derivation fails.
+        """
+        if not len(ikms) == len(salts) == len(infos):
+            raise KeyDerivationError(
+                f"Got {len(ikms)} ikms, {len(salts)} salts and {len(infos)} infos"
+            )
+        if not 0 < length <= _HKDF_MAX_BLOCKS * _SHA512_SIZE:
+            raise KeyDerivationError(f"Invalid HKDF output length: {length}")
+
+        salt_hmacs = {b"": _ZERO_SALT_HMAC}
+        out: List[bytes] = []
+        try:
+            for ikm, salt, info in zip(ikms, salts, infos):
+                if salt is None:
+                    salt = os.urandom(64)
+                salt_hmac = salt_hmacs.get(salt)
+                if salt_hmac is None:
+                    salt_hmac = salt_hmacs[salt] = hmac.HMAC(salt, _SHA512)
+                out.append(_hkdf_fixed_salt(salt_hmac, ikm, info, length))
+        except Exception as exc:
+            raise KeyDerivationError(f"HKDF derivation failed: {exc}") from exc
+        return out
+
     def derive_with_salt(
         self,
         ikm: bytes,
@@ -224,15 +429,28 @@ class QShieldKDF:
         Returns:
             Combined derived key bytes.
         """
-        import struct
-
-        combined = bytearray()
-        for key in keys:
-            combined.extend(struct.pack("<I", len(key)))
-            combined.extend(key)
-        combined.extend(struct.pack("<I", len(keys)))
-
-        return self.derive(bytes(combined), b"", info, length)
+        count = len(keys)
+        if count == 2 and len(keys[0]) == len(keys[1]) == 32:
+            # Hybrid KEM: X25519 and ML-KEM shared secrets
+            combined = _COMBINE_PAIR_32.pack(32, keys[0], 32, keys[1], 2)
+        elif count == 1 and len(keys[0]) == 32:
+            # Classical-only KEM: the X25519 shared secret alone
+            combined = _COMBINE_ONE_32.pack(32, keys[0], 1)
+        else:
+            parts = []
+            for key in keys:
+                parts.append(_U32.pack(len(key)))
+                parts.append(key)
+            parts.append(_U32.pack(len(keys)))
+            combined = b"".join(parts)
+
+        if 0 < length <= _HKDF_MAX_BLOCKS * _SHA512_SIZE:
+            # Always empty-salt SHA-512, so skip derive()'s dispatch
+            try:
+                return _hkdf_fixed_salt(_ZERO_SALT_HMAC, combined, info, length)
+            except Exception as exc:
+                raise KeyDerivationError(f"HKDF derivation failed: {exc}") from exc
+        return self.derive(combined, b"", info, length)
 
     # ------------------------------------------------------------------
     # SHAKE-256 expansion
@@ -249,12 +467,42 @@ class QShieldKDF:
         Returns:
             Expanded key bytes.
         """
-        h = hashlib.shake_256()
+        h = _SHAKE_256.copy()
         h.update(key)
         h.update(info)
         h.update(length.to_bytes(8, "little"))
         return h.digest(length)
 
+    def expand_batch(
+        self,
+        keys: Sequence[bytes],
+        infos: Sequence[bytes],
+        length: int,
+    ) -> List[bytes]:
+        """Expand several independent inputs; each output equals :meth:`expand`.
+
+        Args:
+            keys: Input key material for each output.
+            infos: Context / domain separation string for each output.
+            length: Output length in bytes, shared by the batch.
+
+        Returns:
+            Expanded key bytes, one per ``(key, info)`` pair.
+
+        Raises:
+            KeyDerivationError: If ``keys`` and ``infos`` differ in length.
+        """
+        if len(keys) != len(infos):
+            raise KeyDerivationError(
+                f"Got {len(infos)} infos for {len(keys)} keys"
+            )
+        shake = hashlib.shake_256
+        suffix = length.to_bytes(8, "little")
+        return [
+            shake(b"".join((key, info, suffix))).digest(length)
+            for key, info in zip(keys, infos)
+        ]
+
     # ------------------------------------------------------------------
     # Password-based derivation (Argon2id)
     # ------------------------------------------------------------------
@@ -305,13 +553,9 @@ class QShieldKDF:
 
         # Apply additional HKDF step with domain separation (matches Rust SDK)
         try:
-            hkdf = HKDF(
-                algorithm=hashes.SHA512(),
-                length=length,
-                salt=DOMAIN_PASSWORD,
-                info=b"QShieldPassword-final",
+            return _hkdf_fixed_salt(
+                _PASSWORD_SALT_HMAC, raw, b"QShieldPassword-final", length
             )
-            return hkdf.derive(raw)
         except Exception as exc:
             raise KeyDerivationError(
                 f"Post-Argon2id HKDF step failed: {exc}"
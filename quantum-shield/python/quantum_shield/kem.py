@@ -8,10 +8,16 @@ HKDF-SHA-512 with domain separation.
 Classical-only fallback:
     If the ``oqs`` Python package is not installed, the KEM operates in
     X25519-only mode and issues a :class:`PostQuantumUnavailableWarning`.
+
+X25519 runs through PyNaCl's ``crypto_scalarmult`` when ``pynacl`` is
+installed (one libsodium call per operation instead of several wrapper
+objects), and through ``cryptography`` otherwise. Both produce identical
+keys and shared secrets.
 """
 
 import os
 import struct
+import threading
 import warnings
 from dataclasses import dataclass
 from typing import Optional, Tuple
@@ -21,6 +27,7 @@ from cryptography.hazmat.primitives.asymmetric.x25519 import (
     X25519PublicKey as _X25519PubKey,
 )
 
+from . import _oqs_pool
 from .errors import (
     InvalidKeyError,
     ParseError,
@@ -41,9 +48,145 @@ try:
 except ImportError:
     pass
 
+# ---------------------------------------------------------------------------
+# X25519 (libsodium via PyNaCl when installed)
+# ---------------------------------------------------------------------------
+try:
+    from nacl.bindings import crypto_scalarmult as _scalarmult
+    from nacl.bindings import crypto_scalarmult_base as _scalarmult_base
+except ImportError:
+    _scalarmult = None
+    _scalarmult_base = None
+
+_X25519_SIZE = 32
+
+
+def _x25519_ephemeral(peer_public: bytes) -> Tuple[bytes, bytes]:
+    """ECDH from a fresh ephemeral key; returns ``(ephemeral_public, shared)``.
+
+    Raises:
+        ValueError: If ``peer_public`` is malformed or a low-order point.
+    """
+    if _scalarmult is None:
+        eph_priv = X25519PrivateKey.generate()
+        eph_pub_bytes = eph_priv.public_key().public_bytes_raw()
+        peer_pub = _X25519PubKey.from_public_bytes(peer_public)
+        return eph_pub_bytes, eph_priv.exchange(peer_pub)
+
+    eph_priv_bytes = os.urandom(_X25519_SIZE)
+    try:
+        return _scalarmult_base(eph_priv_bytes), _scalarmult(eph_priv_bytes, peer_public)
+    except Exception as exc:
+        raise ValueError(f"X25519 exchange failed: {exc}") from exc
+
+
+def _x25519_exchange(private: bytes, peer_public: bytes) -> bytes:
+    """ECDH between a raw private key and a raw public key.
+
+    Raises:
+        ValueError: If either key is malformed or the peer is a low-order point.
+    """
+    if _scalarmult is None:
+        priv = X25519PrivateKey.from_private_bytes(private)
+        return priv.exchange(_X25519PubKey.from_public_bytes(peer_public))
+
+    try:
+        return _scalarmult(private, peer_public)
+    except Exception as exc:
+        raise ValueError(f"X25519 exchange failed: {exc}") from exc
+
+
+# Encapsulation binds no secret to the liboqs handle, so each thread keeps
+# one instead of building a fresh ``KeyEncapsulation`` per call. Key
+# generation and decapsulation build their own and free it straight away:
+# a keygen handle holds the new secret key and a decap handle is built around
+# the recipient's, and caching either would keep secret keys alive beyond
+# the caller's control.
+_oqs_local = threading.local()
+
+
+def _ml_kem_handle():
+    """Return this thread's reusable, keyless ML-KEM-768 encapsulation handle."""
+    kem = getattr(_oqs_local, "kem", None)
+    if kem is None:
+        kem = oqs.KeyEncapsulation("ML-KEM-768")  # type: ignore[name-defined]
+        _oqs_local.kem = kem
+    return kem
+
+
+def _ml_kem_encap(ml_kem_public: bytes) -> Tuple[bytes, bytes]:
+    return _ml_kem_handle().encap_secret(ml_kem_public)
+
+
+def _ml_kem_keygen() -> Tuple[bytes, bytes]:
+    # Leaving the block frees the handle, which cleanses its copy of the key
+    with oqs.KeyEncapsulation("ML-KEM-768") as kem:  # type: ignore[name-defined]
+        public = kem.generate_keypair()
+        return public, kem.export_secret_key()
+
+
+def _ml_kem_decap(ml_kem_secret: bytes, ml_kem_ciphertext: bytes) -> bytes:
+    # As for keygen, leaving the block frees the handle and cleanses the key
+    with oqs.KeyEncapsulation("ML-KEM-768", ml_kem_secret) as kem:  # type: ignore[name-defined]
+        return kem.decap_secret(ml_kem_ciphertext)
+
+
 # Shared secret size for the combined KEM
 QSHIELD_SHARED_SECRET_SIZE = 64
 
+# HKDF combination never reads the Argon2 config, so one instance serves
+# every encapsulation and decapsulation
+_DEFAULT_KDF = QShieldKDF()
+
+# Wire format shared by keys and ciphertexts:
+#   u32 len || x25519 || u32 len || ml_kem   (lengths little-endian)
+# X25519 values are always 32 bytes and each ML-KEM-768 field has a fixed
+# size, so the usual shapes pack and unpack with one precompiled Struct.
+_U32 = struct.Struct("<I")
+_CLASSICAL_WIRE = struct.Struct(f"<I{_X25519_SIZE}sI")
+_PUBLIC_KEY_WIRE = struct.Struct(f"<I{_X25519_SIZE}sI1184s")
+_SECRET_KEY_WIRE = struct.Struct(f"<I{_X25519_SIZE}sI2400s")
+_CIPHERTEXT_WIRE = struct.Struct(f"<I{_X25519_SIZE}sI1088s")
+
+
+def _pack_fields(wire: struct.Struct, x25519: bytes, ml_kem: bytes) -> bytes:
+    """Serialize both fields, using ``wire`` when they have its fixed sizes."""
+    x_len = len(x25519)
+    m_len = len(ml_kem)
+    if x_len == _X25519_SIZE:
+        if m_len == wire.size - _CLASSICAL_WIRE.size:
+            return wire.pack(x_len, x25519, m_len, ml_kem)
+        if not m_len:
+            return _CLASSICAL_WIRE.pack(x_len, x25519, 0)
+    return b"".join((_U32.pack(x_len), x25519, _U32.pack(m_len), ml_kem))
+
+
+def _unpack_fields(wire: struct.Struct, data: bytes) -> Tuple[bytes, bytes]:
+    """Parse both fields from any bytes-like ``data``.
+
+    Raises ``struct.error`` on a truncated length prefix.
+    """
+    size = len(data)
+    if size == wire.size:
+        x_len, x25519, m_len, ml_kem = wire.unpack(data)
+        if x_len == _X25519_SIZE and m_len == size - _CLASSICAL_WIRE.size:
+            return x25519, ml_kem
+    elif size == _CLASSICAL_WIRE.size:
+        x_len, x25519, m_len = _CLASSICAL_WIRE.unpack(data)
+        if x_len == _X25519_SIZE and not m_len:
+            return x25519, b""
+
+    # Any other shape: slice a view so each field is copied once, into
+    # ``bytes``, whatever buffer type the caller passed
+    view = memoryview(data)
+    (x_len,) = _U32.unpack_from(view, 0)
+    offset = 4 + x_len
+    x25519 = bytes(view[4:offset])
+    (m_len,) = _U32.unpack_from(view, offset)
+    offset += 4
+    ml_kem = bytes(view[offset : offset + m_len])
+    return x25519, ml_kem
+
 
 # ---------------------------------------------------------------------------
 # Key / ciphertext wrapper classes
@@ -63,25 +206,13 @@ class QShieldKEMPublicKey:
 
     def to_bytes(self) -> bytes:
         """Serialize to a length-prefixed wire format."""
-        buf = bytearray()
-        buf.extend(struct.pack("<I", len(self.x25519)))
-        buf.extend(self.x25519)
-        buf.extend(struct.pack("<I", len(self.ml_kem)))
-        buf.extend(self.ml_kem)
-        return bytes(buf)
+        return _pack_fields(_PUBLIC_KEY_WIRE, self.x25519, self.ml_kem)
 
     @classmethod
     def from_bytes(cls, data: bytes) -> "QShieldKEMPublicKey":
         """Deserialize from wire format."""
         try:
-            offset = 0
-            (x_len,) = struct.unpack_from("<I", data, offset)
-            offset += 4
-            x25519 = data[offset : offset + x_len]
-            offset += x_len
-            (m_len,) = struct.unpack_from("<I", data, offset)
-            offset += 4
-            ml_kem = data[offset : offset + m_len]
+            x25519, ml_kem = _unpack_fields(_PUBLIC_KEY_WIRE, data)
             return cls(x25519=x25519, ml_kem=ml_kem)
         except Exception as exc:
             raise ParseError(f"Failed to parse KEM public key: {exc}") from exc
@@ -101,25 +232,13 @@ class QShieldKEMSecretKey:
 
     def to_bytes(self) -> bytes:
         """Serialize to wire format."""
-        buf = bytearray()
-        buf.extend(struct.pack("<I", len(self.x25519)))
-        buf.extend(self.x25519)
-        buf.extend(struct.pack("<I", len(self.ml_kem)))
-        buf.extend(self.ml_kem)
-        return bytes(buf)
+        return _pack_fields(_SECRET_KEY_WIRE, self.x25519, self.ml_kem)
 
     @classmethod
     def from_bytes(cls, data: bytes) -> "QShieldKEMSecretKey":
         """Deserialize from wire format."""
         try:
-            offset = 0
-            (x_len,) = struct.unpack_from("<I", data, offset)
-            offset += 4
-            x25519 = data[offset : offset + x_len]
-            offset += x_len
-            (m_len,) = struct.unpack_from("<I", data, offset)
-            offset += 4
-            ml_kem = data[offset : offset + m_len]
+            x25519, ml_kem = _unpack_fields(_SECRET_KEY_WIRE, data)
             return cls(x25519=x25519, ml_kem=ml_kem)
         except Exception as exc:
             raise ParseError(f"Failed to parse KEM secret key: {exc}") from exc
@@ -151,25 +270,13 @@ class QShieldKEMCiphertext:
 
     def to_bytes(self) -> bytes:
         """Serialize to wire format."""
-        buf = bytearray()
-        buf.extend(struct.pack("<I", len(self.x25519)))
-        buf.extend(self.x25519)
-        buf.extend(struct.pack("<I", len(self.ml_kem)))
-        buf.extend(self.ml_kem)
-        return bytes(buf)
+        return _pack_fields(_CIPHERTEXT_WIRE, self.x25519, self.ml_kem)
 
     @classmethod
     def from_bytes(cls, data: bytes) -> "QShieldKEMCiphertext":
         """Deserialize from wire format."""
         try:
-            offset = 0
-            (x_len,) = struct.unpack_from("<I", data, offset)
-            offset += 4
-            x25519 = data[offset : offset + x_len]
-            offset += x_len
-            (m_len,) = struct.unpack_from("<I", data, offset)
-            offset += 4
-            ml_kem = data[offset : offset + m_len]
+            x25519, ml_kem = _unpack_fields(_CIPHERTEXT_WIRE, data)
             return cls(x25519=x25519, ml_kem=ml_kem)
         except Exception as exc:
             raise ParseError(f"Failed to parse KEM ciphertext: {exc}") from exc
@@ -219,9 +326,7 @@ class QShieldKEM:
 
         if _PQ_BACKEND == "oqs":
             try:
-                kem = oqs.KeyEncapsulation("ML-KEM-768")  # type: ignore[name-defined]
-                ml_pub_bytes = kem.generate_keypair()
-                ml_priv_bytes = kem.export_secret_key()
+                ml_pub_bytes, ml_priv_bytes = _ml_kem_keygen()
             except Exception:
                 warnings.warn(
                     "ML-KEM-768 key generation failed; falling back to X25519 only",
@@ -258,21 +363,22 @@ class QShieldKEM:
             A ``(ciphertext, shared_secret)`` tuple where ``shared_secret``
             is ``QSHIELD_SHARED_SECRET_SIZE`` bytes.
         """
-        # --- X25519 encapsulation (ECDH with ephemeral key) ---
-        eph_priv = X25519PrivateKey.generate()
-        eph_pub_bytes = eph_priv.public_key().public_bytes_raw()
+        use_pq = bool(public_key.ml_kem) and _PQ_BACKEND == "oqs"
+        job = _oqs_pool.submit(_ml_kem_encap, public_key.ml_kem) if use_pq else None
 
-        peer_pub = _X25519PubKey.from_public_bytes(public_key.x25519)
-        x25519_ss = eph_priv.exchange(peer_pub)  # 32 bytes
+        # --- X25519 encapsulation (ECDH with ephemeral key) ---
+        eph_pub_bytes, x25519_ss = _x25519_ephemeral(public_key.x25519)  # 32 bytes
 
         # --- ML-KEM-768 encapsulation (optional) ---
         ml_kem_ct = b""
         ml_kem_ss = b""
 
-        if public_key.ml_kem and _PQ_BACKEND == "oqs":
+        if use_pq:
             try:
-                kem = oqs.KeyEncapsulation("ML-KEM-768")  # type: ignore[name-defined]
-                ml_kem_ct, ml_kem_ss = kem.encap_secret(public_key.ml_kem)
+                if job is not None:
+                    ml_kem_ct, ml_kem_ss = job.result()
+                else:
+                    ml_kem_ct, ml_kem_ss = _ml_kem_encap(public_key.ml_kem)
             except Exception:
                 warnings.warn(
                     "ML-KEM-768 encapsulation failed; using X25519 only",
@@ -300,22 +406,27 @@ class QShieldKEM:
         Returns:
             The shared secret (``QSHIELD_SHARED_SECRET_SIZE`` bytes).
         """
+        use_pq = (
+            bool(secret_key.ml_kem)
+            and bool(ciphertext.ml_kem)
+            and _PQ_BACKEND == "oqs"
+        )
+        job = None
+        if use_pq:
+            job = _oqs_pool.submit(_ml_kem_decap, secret_key.ml_kem, ciphertext.ml_kem)
+
         # --- X25519 decapsulation ---
-        priv = X25519PrivateKey.from_private_bytes(secret_key.x25519)
-        peer_eph_pub = _X25519PubKey.from_public_bytes(ciphertext.x25519)
-        x25519_ss = priv.exchange(peer_eph_pub)
+        x25519_ss = _x25519_exchange(secret_key.x25519, ciphertext.x25519)
 
         # --- ML-KEM-768 decapsulation (optional) ---
         ml_kem_ss = b""
 
-        if (
-            secret_key.ml_kem
-            and ciphertext.ml_kem
-            and _PQ_BACKEND == "oqs"
-        ):
+        if use_pq:
             try:
-                kem = oqs.KeyEncapsulation("ML-KEM-768", secret_key.ml_kem)  # type: ignore[name-defined]
-                ml_kem_ss = kem.decap_secret(ciphertext.ml_kem)
+                if job is not None:
+                    ml_kem_ss = job.result()
+                else:
+                    ml_kem_ss = _ml_kem_decap(secret_key.ml_kem, ciphertext.ml_kem)
             except Exception:
                 warnings.warn(
                     "ML-KEM-768 decapsulation failed; using X25519 only",
@@ -340,8 +451,5 @@ class QShieldKEM:
 
         If ``ml_kem_ss`` is empty, derivation is based on X25519 alone.
         """
-        kdf = QShieldKDF()
-        parts = [x25519_ss]
-        if ml_kem_ss:
-            parts.append(ml_kem_ss)
-        return kdf.combine(parts, DOMAIN_KEM_COMBINE, QSHIELD_SHARED_SECRET_SIZE)
+        parts = (x25519_ss, ml_kem_ss) if ml_kem_ss else (x25519_ss,)
+        return _DEFAULT_KDF.combine(parts, DOMAIN_KEM_COMBINE, QSHIELD_SHARED_SECRET_SIZE)
@@ -18,12 +18,16 @@ The wire format uses length-prefixed fields so that signatures from
 different backend configurations can be detected and rejected.
 """
 
+import functools
 import hashlib
+import hmac
+import os
 import struct
+import threading
 import time
 import warnings
-from dataclasses import dataclass
-from typing import Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from cryptography.hazmat.primitives.asymmetric.ed25519 import (
     Ed25519PrivateKey,
@@ -31,6 +35,7 @@ from cryptography.hazmat.primitives.asymmetric.ed25519 import (
 )
 from cryptography.exceptions import InvalidSignature
 
+from . import _oqs_pool
 from .errors import (
     ParseError,
     PostQuantumUnavailableWarning,
@@ -50,6 +55,94 @@ try:
 except ImportError:
     pass
 
+# Little-endian wire integers (see the to_bytes/from_bytes methods below)
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+# Signature header: flags (u16) followed by the scheme length (u32)
+_SIG_HEADER = struct.Struct("<HI")
+# Timestamped message hash prefix: timestamp then message length (u64 each)
+_TS_LEN = struct.Struct("<QQ")
+
+# SHA3-256 states with the signing domain tags already absorbed; copying
+# one is cheaper than constructing and feeding a fresh hash per message
+_SHA3_SIGN = hashlib.sha3_256(b"QShieldSign-v1")
+_SHA3_SIGN_TS = hashlib.sha3_256(b"QShieldSign-ts-v1")
+_SHA3_FINGERPRINT = hashlib.sha3_256(b"QShieldSign-fingerprint-v1")
+
+
+def _wire_view(data, what: str):
+    """Return ``data`` if it is bytes, else a flat byte view over it.
+
+    Slicing bytes already copies; any other buffer goes through a view so
+    each field is copied once, straight into bytes.
+    """
+    if type(data) is bytes:
+        return data
+    try:
+        return memoryview(data).cast("B")
+    except TypeError as exc:
+        raise ParseError(f"Failed to parse {what}: {exc}") from exc
+
+
+def _read_prefixed(view, offset: int, what: str) -> Tuple[bytes, int]:
+    """Read one u32-length-prefixed field; return it and the next offset."""
+    start = offset + 4
+    if start > len(view):
+        raise ParseError(f"Failed to parse {what}: truncated length prefix")
+    (size,) = _U32.unpack_from(view, offset)
+    end = start + size
+    if end > len(view):
+        raise ParseError(
+            f"Failed to parse {what}: field of {size} bytes exceeds the "
+            f"{len(view) - start} remaining"
+        )
+    return bytes(view[start:end]), end
+
+
+# The schemes this module produces, so parsing them needs no UTF-8 decode
+# and yields the same interned strings sign/verify compare against
+_KNOWN_SCHEMES = {b"classical": "classical", b"pq": "pq"}
+
+
+def _decode_scheme(raw, what: str) -> str:
+    if type(raw) is bytes:
+        scheme = _KNOWN_SCHEMES.get(raw)
+        if scheme is not None:
+            return scheme
+    try:
+        return str(raw, "utf-8")
+    except UnicodeDecodeError as exc:
+        raise ParseError(f"Failed to parse {what}: {exc}") from exc
+
+
+@functools.lru_cache(maxsize=1024)
+def _ed25519_public_key(raw: bytes) -> _Ed25519PubKey:
+    """Parse an Ed25519 public key, reusing the object for repeat verifiers."""
+    return _Ed25519PubKey.from_public_bytes(raw)
+
+
+# Verification binds no key to the liboqs handle, so each thread keeps one
+# instead of building a fresh ``Signature`` per call. Signing handles hold
+# the secret key and live on the QShieldSignSecretKey they belong to.
+_oqs_local = threading.local()
+
+
+def _ml_dsa_verifier():
+    """Return this thread's reusable, keyless ML-DSA-65 handle."""
+    verifier = getattr(_oqs_local, "verifier", None)
+    if verifier is None:
+        verifier = oqs.Signature("ML-DSA-65")  # type: ignore[name-defined]
+        _oqs_local.verifier = verifier
+    return verifier
+
+
+def _ml_dsa_verify(msg_hash: bytes, signature: bytes, public_key: bytes) -> bool:
+    try:
+        verifier = _ml_dsa_verifier()
+        return bool(verifier.verify(msg_hash, signature, public_key))
+    except Exception:
+        return False
+
 
 # ---------------------------------------------------------------------------
 # Key / signature wrapper classes
@@ -69,49 +162,45 @@ class QShieldSignPublicKey:
     primary: bytes
     secondary: bytes
     scheme: str = "classical"
+    # Last fingerprint, with the field objects it was computed from
+    _fingerprint: Optional[Tuple[bytes, bytes, bytes]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_bytes(self) -> bytes:
         """Serialize to wire format."""
         scheme_bytes = self.scheme.encode("utf-8")
-        buf = bytearray()
-        buf.extend(struct.pack("<I", len(scheme_bytes)))
-        buf.extend(scheme_bytes)
-        buf.extend(struct.pack("<I", len(self.primary)))
-        buf.extend(self.primary)
-        buf.extend(struct.pack("<I", len(self.secondary)))
-        buf.extend(self.secondary)
-        return bytes(buf)
+        return b"".join((
+            _U32.pack(len(scheme_bytes)), scheme_bytes,
+            _U32.pack(len(self.primary)), self.primary,
+            _U32.pack(len(self.secondary)), self.secondary,
+        ))
 
     @classmethod
     def from_bytes(cls, data: bytes) -> "QShieldSignPublicKey":
         """Deserialize from wire format."""
-        try:
-            offset = 0
-            (s_len,) = struct.unpack_from("<I", data, offset)
-            offset += 4
-            scheme = data[offset : offset + s_len].decode("utf-8")
-            offset += s_len
-            (p_len,) = struct.unpack_from("<I", data, offset)
-            offset += 4
-            primary = data[offset : offset + p_len]
-            offset += p_len
-            (sec_len,) = struct.unpack_from("<I", data, offset)
-            offset += 4
-            secondary = data[offset : offset + sec_len]
-            return cls(primary=primary, secondary=secondary, scheme=scheme)
-        except Exception as exc:
-            raise ParseError(f"Failed to parse sign public key: {exc}") from exc
+        what = "sign public key"
+        view = _wire_view(data, what)
+        scheme, offset = _read_prefixed(view, 0, what)
+        primary, offset = _read_prefixed(view, offset, what)
+        secondary, _ = _read_prefixed(view, offset, what)
+        # Positional arguments (field order) skip keyword matching
+        return cls(primary, secondary, _decode_scheme(scheme, what))
 
     def fingerprint(self) -> bytes:
         """Compute a SHA3-256 fingerprint of this public key."""
-        h = hashlib.sha3_256()
-        h.update(b"QShieldSign-fingerprint-v1")
-        h.update(self.primary)
-        h.update(self.secondary)
-        return h.digest()
-
-
-@dataclass
+        primary, secondary = self.primary, self.secondary
+        cached = self._fingerprint
+        if cached is None or cached[0] is not primary or cached[1] is not secondary:
+            h = _SHA3_FINGERPRINT.copy()
+            h.update(primary)
+            h.update(secondary)
+            cached = (primary, secondary, h.digest())
+            self._fingerprint = cached
+        return cached[2]
+
+
+@dataclass(eq=False)
 class QShieldSignSecretKey:
     """Combined secret key for the dual signature scheme.
 
@@ -124,38 +213,62 @@ class QShieldSignSecretKey:
     primary: bytes
     secondary: bytes
     scheme: str = "classical"
+    # Signer objects built from this key's fields, keyed by (field name,
+    # algorithm) and stored with the raw bytes they were built from. Kept
+    # on the instance rather than in a module-level cache so secret
+    # material goes away with the key object.
+    _signers: Dict[Tuple[str, str], Tuple[bytes, Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def to_bytes(self) -> bytes:
         """Serialize to wire format."""
         scheme_bytes = self.scheme.encode("utf-8")
-        buf = bytearray()
-        buf.extend(struct.pack("<I", len(scheme_bytes)))
-        buf.extend(scheme_bytes)
-        buf.extend(struct.pack("<I", len(self.primary)))
-        buf.extend(self.primary)
-        buf.extend(struct.pack("<I", len(self.secondary)))
-        buf.extend(self.secondary)
-        return bytes(buf)
+        return b"".join((
+            _U32.pack(len(scheme_bytes)), scheme_bytes,
+            _U32.pack(len(self.primary)), self.primary,
+            _U32.pack(len(self.secondary)), self.secondary,
+        ))
+
+    def __eq__(self, other: object) -> bool:
+        # Constant-time key comparison, so equality checks never reveal how
+        # much of a guessed secret key matches
+        if not isinstance(other, QShieldSignSecretKey):
+            return NotImplemented
+        primary_eq = hmac.compare_digest(self.primary, other.primary)
+        secondary_eq = hmac.compare_digest(self.secondary, other.secondary)
+        return primary_eq & secondary_eq & (self.scheme == other.scheme)
+
+    def _signer(self, name: str, algorithm: str, build: Callable[[bytes], Any]) -> Any:
+        raw = getattr(self, name)
+        cached = self._signers.get((name, algorithm))
+        if cached is None or cached[0] is not raw:
+            cached = (raw, build(raw))
+            self._signers[(name, algorithm)] = cached
+        return cached[1]
+
+    def _ed25519_signer(self, name: str) -> Ed25519PrivateKey:
+        """Return the Ed25519 key held in field ``name``, parsing it once."""
+        return self._signer(name, "ed25519", Ed25519PrivateKey.from_private_bytes)
+
+    def _ml_dsa_signer(self) -> Any:
+        """Return an ML-DSA-65 signer for the primary field, built once."""
+        return self._signer(
+            "primary",
+            "ml-dsa-65",
+            lambda raw: oqs.Signature("ML-DSA-65", raw),  # type: ignore[name-defined]
+        )
 
     @classmethod
     def from_bytes(cls, data: bytes) -> "QShieldSignSecretKey":
         """Deserialize from wire format."""
-        try:
-            offset = 0
-            (s_len,) = struct.unpack_from("<I", data, offset)
-            offset += 4
-            scheme = data[offset : offset + s_len].decode("utf-8")
-            offset += s_len
-            (p_len,) = struct.unpack_from("<I", data, offset)
-            offset += 4
-            primary = data[offset : offset + p_len]
-            offset += p_len
-            (sec_len,) = struct.unpack_from("<I", data, offset)
-            offset += 4
-            secondary = data[offset : offset + sec_len]
-            return cls(primary=primary, secondary=secondary, scheme=scheme)
-        except Exception as exc:
-            raise ParseError(f"Failed to parse sign secret key: {exc}") from exc
+        what = "sign secret key"
+        view = _wire_view(data, what)
+        scheme, offset = _read_prefixed(view, 0, what)
+        primary, offset = _read_prefixed(view, offset, what)
+        secondary, _ = _read_prefixed(view, offset, what)
+        # Positional arguments (field order) skip keyword matching
+        return cls(primary, secondary, _decode_scheme(scheme, what))
 
 
 @dataclass
@@ -178,48 +291,36 @@ class QShieldSignature:
         """Serialize to wire format."""
         scheme_bytes = self.scheme.encode("utf-8")
         flags = 0x01 if self.timestamp is not None else 0x00
-        buf = bytearray()
-        buf.extend(struct.pack("<H", flags))
-        buf.extend(struct.pack("<I", len(scheme_bytes)))
-        buf.extend(scheme_bytes)
-        buf.extend(struct.pack("<I", len(self.primary)))
-        buf.extend(self.primary)
-        buf.extend(struct.pack("<I", len(self.secondary)))
-        buf.extend(self.secondary)
+        parts = [
+            _SIG_HEADER.pack(flags, len(scheme_bytes)), scheme_bytes,
+            _U32.pack(len(self.primary)), self.primary,
+            _U32.pack(len(self.secondary)), self.secondary,
+        ]
         if self.timestamp is not None:
-            buf.extend(struct.pack("<Q", self.timestamp))
-        return bytes(buf)
+            parts.append(_U64.pack(self.timestamp))
+        return b"".join(parts)
 
     @classmethod
     def from_bytes(cls, data: bytes) -> "QShieldSignature":
         """Deserialize from wire format."""
-        try:
-            offset = 0
-            (flags,) = struct.unpack_from("<H", data, offset)
-            offset += 2
-            (s_len,) = struct.unpack_from("<I", data, offset)
-            offset += 4
-            scheme = data[offset : offset + s_len].decode("utf-8")
-            offset += s_len
-            (p_len,) = struct.unpack_from("<I", data, offset)
-            offset += 4
-            primary = data[offset : offset + p_len]
-            offset += p_len
-            (sec_len,) = struct.unpack_from("<I", data, offset)
-            offset += 4
-            secondary = data[offset : offset + sec_len]
-            offset += sec_len
-            timestamp = None
-            if flags & 0x01:
-                (timestamp,) = struct.unpack_from("<Q", data, offset)
-            return cls(
-                primary=primary,
-                secondary=secondary,
-                scheme=scheme,
-                timestamp=timestamp,
-            )
-        except Exception as exc:
-            raise ParseError(f"Failed to parse signature: {exc}") from exc
+        what = "signature"
+        view = _wire_view(data, what)
+        if len(view) < _SIG_HEADER.size:
+            raise ParseError("Failed to parse signature: truncated header")
+        flags, s_len = _SIG_HEADER.unpack_from(view, 0)
+        offset = _SIG_HEADER.size + s_len
+        if offset > len(view):
+            raise ParseError("Failed to parse signature: truncated scheme")
+        scheme = _decode_scheme(view[_SIG_HEADER.size : offset], what)
+        primary, offset = _read_prefixed(view, offset, what)
+        secondary, offset = _read_prefixed(view, offset, what)
+        timestamp = None
+        if flags & 0x01:
+            if offset + 8 > len(view):
+                raise ParseError("Failed to parse signature: truncated timestamp")
+            (timestamp,) = _U64.unpack_from(view, offset)
+        # Positional arguments (field order) skip keyword matching
+        return cls(primary, secondary, scheme, timestamp)
 
 
 # ---------------------------------------------------------------------------
@@ -336,6 +437,15 @@ class QShieldSign:
         Returns:
             ``True`` if both signatures are valid, ``False`` otherwise.
         """
+        return QShieldSign._verify(public_key, message, signature, offload=True)
+
+    @staticmethod
+    def _verify(
+        public_key: QShieldSignPublicKey,
+        message: bytes,
+        signature: QShieldSignature,
+        offload: bool,
+    ) -> bool:
         if signature.timestamp is not None:
             msg_hash = QShieldSign._hash_message_with_timestamp(
                 message, signature.timestamp
@@ -344,28 +454,89 @@ class QShieldSign:
             msg_hash = QShieldSign._hash_message(message)
 
         if public_key.scheme == "pq":
-            return QShieldSign._verify_pq(public_key, msg_hash, signature)
+            return QShieldSign._verify_pq(public_key, msg_hash, signature, offload)
         else:
             return QShieldSign._verify_classical(public_key, msg_hash, signature)
 
+    @staticmethod
+    def verify_batch(
+        public_keys: Sequence[QShieldSignPublicKey],
+        messages: Sequence[bytes],
+        signatures: Sequence[QShieldSignature],
+        workers: Optional[int] = None,
+    ) -> List[bool]:
+        """Verify many dual signatures, reporting each one separately.
+
+        Every signature is checked on its own, exactly as :meth:`verify`
+        would, so one bad signature never masks the others. Repeated
+        public keys are parsed once. When any key is post-quantum, the
+        batch is cut into one contiguous slice per worker and each worker
+        runs its ML-DSA checks inline, in liboqs without the GIL. Batches
+        of classical keys stay on the calling thread: cryptography holds
+        the GIL for Ed25519, so worker threads would only add hand-offs.
+
+        Args:
+            public_keys: Verification key for each signature.
+            messages: Signed message for each signature.
+            signatures: The signatures to verify.
+            workers: Number of threads. Defaults to ``os.cpu_count()``.
+
+        Returns:
+            One ``bool`` per signature, in input order.
+
+        Raises:
+            SignatureError: If the three sequences differ in length or
+                ``workers`` is not positive.
+        """
+        count = len(signatures)
+        if len(public_keys) != count or len(messages) != count:
+            raise SignatureError(
+                f"Got {len(public_keys)} public keys and {len(messages)} "
+                f"messages for {count} signatures"
+            )
+        if workers is None:
+            workers = os.cpu_count() or 1
+        elif workers < 1:
+            raise SignatureError(f"workers must be positive, got {workers}")
+
+        def run(start: int, stop: int, offload: bool) -> List[bool]:
+            return [
+                QShieldSign._verify(public_keys[i], messages[i], signatures[i], offload)
+                for i in range(start, stop)
+            ]
+
+        workers = min(workers, count)
+        if workers <= 1 or not any(key.scheme == "pq" for key in public_keys):
+            # On one thread, ML-DSA may still overlap Ed25519 as in verify()
+            return run(0, count, True)
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        step = -(-count // workers)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(run, start, min(start + step, count), False)
+                for start in range(0, count, step)
+            ]
+            return [ok for future in futures for ok in future.result()]
+
     # ------------------------------------------------------------------
     # Message hashing (domain separated, matching Rust SDK)
     # ------------------------------------------------------------------
 
     @staticmethod
     def _hash_message(message: bytes) -> bytes:
-        h = hashlib.sha3_256()
-        h.update(b"QShieldSign-v1")
-        h.update(len(message).to_bytes(8, "little"))
+        # The message is absorbed on its own so large payloads are never
+        # copied into a prefix buffer
+        h = _SHA3_SIGN.copy()
+        h.update(_U64.pack(len(message)))
         h.update(message)
         return h.digest()
 
     @staticmethod
     def _hash_message_with_timestamp(message: bytes, timestamp: int) -> bytes:
-        h = hashlib.sha3_256()
-        h.update(b"QShieldSign-ts-v1")
-        h.update(timestamp.to_bytes(8, "little"))
-        h.update(len(message).to_bytes(8, "little"))
+        h = _SHA3_SIGN_TS.copy()
+        h.update(_TS_LEN.pack(timestamp, len(message)))
         h.update(message)
         return h.digest()
 
@@ -398,9 +569,13 @@ class QShieldSign:
         secret_key: QShieldSignSecretKey, msg_hash: bytes
     ) -> QShieldSignature:
         try:
-            priv1 = Ed25519PrivateKey.from_private_bytes(secret_key.primary)
-            priv2 = Ed25519PrivateKey.from_private_bytes(secret_key.secondary)
+            priv1 = secret_key._ed25519_signer("primary")
+            priv2 = secret_key._ed25519_signer("secondary")
 
+            # Deliberately sequential (here and in _verify_classical):
+            # cryptography keeps the GIL for Ed25519, so a worker thread
+            # cannot overlap the two operations and the hand-off (~15 us)
+            # only adds latency to a ~40 us sign.
             sig1 = priv1.sign(msg_hash)
             sig2 = priv2.sign(msg_hash)
 
@@ -417,7 +592,7 @@ class QShieldSign:
         signature: QShieldSignature,
     ) -> bool:
         try:
-            pub1 = _Ed25519PubKey.from_public_bytes(public_key.primary)
+            pub1 = _ed25519_public_key(bytes(public_key.primary))
             pub1.verify(signature.primary, msg_hash)
         except InvalidSignature:
             return False
@@ -425,7 +600,7 @@ class QShieldSign:
             return False
 
         try:
-            pub2 = _Ed25519PubKey.from_public_bytes(public_key.secondary)
+            pub2 = _ed25519_public_key(bytes(public_key.secondary))
             pub2.verify(signature.secondary, msg_hash)
         except InvalidSignature:
             return False
@@ -473,11 +648,10 @@ class QShieldSign:
     ) -> QShieldSignature:
         try:
             # ML-DSA-65
-            signer = oqs.Signature("ML-DSA-65", secret_key.primary)  # type: ignore[name-defined]
-            ml_sig = signer.sign(msg_hash)
+            ml_sig = secret_key._ml_dsa_signer().sign(msg_hash)
 
             # Ed25519
-            ed_priv = Ed25519PrivateKey.from_private_bytes(secret_key.secondary)
+            ed_priv = secret_key._ed25519_signer("secondary")
             ed_sig = ed_priv.sign(msg_hash)
 
             return QShieldSignature(
@@ -491,23 +665,33 @@ class QShieldSign:
         public_key: QShieldSignPublicKey,
         msg_hash: bytes,
         signature: QShieldSignature,
+        offload: bool,
     ) -> bool:
-        # ML-DSA-65
-        try:
-            verifier = oqs.Signature("ML-DSA-65")  # type: ignore[name-defined]
-            ml_valid = verifier.verify(msg_hash, signature.primary, public_key.primary)
-            if not ml_valid:
-                return False
-        except Exception:
-            return False
+        # ML-DSA-65 starts first so it overlaps the Ed25519 check; batch
+        # workers pass offload=False, as they already run in parallel
+        job = (
+            _oqs_pool.submit(
+                _ml_dsa_verify, msg_hash, signature.primary, public_key.primary
+            )
+            if offload
+            else None
+        )
 
         # Ed25519
         try:
-            pub = _Ed25519PubKey.from_public_bytes(public_key.secondary)
+            pub = _ed25519_public_key(bytes(public_key.secondary))
             pub.verify(signature.secondary, msg_hash)
+            ed_valid = True
         except InvalidSignature:
-            return False
+            ed_valid = False
         except Exception:
-            return False
-
-        return True
+            ed_valid = False
+
+        if job is not None:
+            # Always collect the result so the worker finishes before return
+            ml_valid = job.result()
+            return ml_valid and ed_valid
+        # Inline: the cheaper Ed25519 check short-circuits ML-DSA
+        return ed_valid and _ml_dsa_verify(
+            msg_hash, signature.primary, public_key.primary
+        )
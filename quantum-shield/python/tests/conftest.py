@@ -0,0 +1,34 @@
+"""Shared fixtures for the QuantumShield test suite."""
+
+import warnings
+
+import pytest
+
+from quantum_shield import PostQuantumUnavailableWarning, QShieldKEM, QShieldSign
+
+
+def _quiet_keypair(generate):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", PostQuantumUnavailableWarning)
+        return generate()
+
+
+# Key generation dominates the signing and KEM tests, so read-only tests share
+# one keypair per session. Tests that mutate a key must generate their own.
+
+@pytest.fixture(scope="session")
+def qshield_sign_keypair():
+    """A ``(public_key, secret_key)`` signing pair shared across the session."""
+    return _quiet_keypair(QShieldSign.generate_keypair)
+
+
+@pytest.fixture(scope="session")
+def qshield_sign_keypair_alt():
+    """A second, unrelated signing pair for wrong-key tests."""
+    return _quiet_keypair(QShieldSign.generate_keypair)
+
+
+@pytest.fixture(scope="session")
+def qshield_kem_keypair():
+    """A ``(public_key, secret_key)`` KEM pair shared across the session."""
+    return _quiet_keypair(QShieldKEM.generate_keypair)
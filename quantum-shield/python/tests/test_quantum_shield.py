@@ -6,8 +6,9 @@ X25519, Ed25519, HKDF, Argon2id) which works with only the ``cryptography``
 and ``argon2-cffi`` packages installed.
 """
 
+import hashlib
+import io
 import os
-import warnings
 
 import pytest
 
@@ -38,6 +39,7 @@ from quantum_shield import (
     CHACHA_TAG_SIZE,
     QSHIELD_KEY_SIZE,
     QSHIELD_OVERHEAD,
+    QSHIELD_SINGLE_OVERHEAD,
     # KEM
     QShieldKEM,
     QShieldKEMPublicKey,
@@ -55,6 +57,20 @@ from quantum_shield import (
     DerivedKey,
 )
 
+# Without oqs every PQ-capable call warns; the classical path is what these
+# tests exercise, so the warning is silenced for the whole module
+pytestmark = pytest.mark.filterwarnings(
+    "ignore::quantum_shield.PostQuantumUnavailableWarning"
+)
+
+# Cheapest Argon2id settings for tests that check password-derivation
+# behaviour rather than hardness: one lane (no worker threads), one pass
+FAST_ARGON2 = KdfConfig(memory_cost=8192, time_cost=1, parallelism=1)
+
+# Fixed, distinct salts so password-derivation tests are reproducible
+SALT_A = bytes(range(32))
+SALT_B = bytes(range(32, 64))
+
 
 # ===========================================================================
 # Module-level sanity
@@ -167,6 +183,108 @@ class TestQuantumShield:
         with pytest.raises(DecryptionError):
             cipher.decrypt_with_aad(ciphertext, b"wrong aad")
 
+    def test_siv_mode(self):
+        try:
+            siv = QuantumShield(b"test key material", siv=True)
+        except QShieldError:
+            pytest.skip("AES-GCM-SIV not available")
+        plaintext = b"Test message"
+
+        ciphertext = siv.encrypt(plaintext)
+        assert len(ciphertext) == len(plaintext) + QSHIELD_SINGLE_OVERHEAD
+        assert siv.message_overhead() == QSHIELD_SINGLE_OVERHEAD
+        assert siv.decrypt(ciphertext) == plaintext
+
+        # Keyed separately from the plain single-layer mode
+        single = QuantumShield(b"test key material", cascade=False)
+        with pytest.raises(DecryptionError):
+            single.decrypt(ciphertext)
+
+    def test_encrypt_many(self):
+        cipher = QuantumShield(b"test key material")
+        plaintexts = [b"", b"first", os.urandom(300)]
+
+        ciphertexts = cipher.encrypt_many(plaintexts)
+        assert [cipher.decrypt(ct) for ct in ciphertexts] == plaintexts
+        assert len(set(ciphertexts)) == len(plaintexts)
+
+        sealed = cipher.encrypt_many(plaintexts, [b"a", b"b", b"c"])
+        assert cipher.decrypt_with_aad(sealed[1], b"b") == b"first"
+        assert cipher.decrypt_many(sealed, [b"a", b"b", b"c"]) == plaintexts
+
+        with pytest.raises(EncryptionError):
+            cipher.encrypt_many(plaintexts, [b"a"])
+        with pytest.raises(DecryptionError):
+            cipher.decrypt_many(sealed, [b"a", b"x", b"c"])
+        with pytest.raises(InvalidCiphertextError):
+            cipher.decrypt_many([ciphertexts[0], b"short"])
+
+    def test_encrypt_many_parallel(self):
+        cipher = QuantumShield(b"test key material")
+        plaintexts = [os.urandom(i) for i in range(7)]
+        aads = [bytes([i]) for i in range(7)]
+
+        ciphertexts = cipher.encrypt_many_parallel(plaintexts, aads, workers=3)
+        assert [
+            cipher.decrypt_with_aad(ct, aad) for ct, aad in zip(ciphertexts, aads)
+        ] == plaintexts
+
+        with pytest.raises(EncryptionError):
+            cipher.encrypt_many_parallel(plaintexts, workers=0)
+
+    def test_decrypt_into(self):
+        cipher = QuantumShield(b"test key material")
+        plaintext = os.urandom(1000)
+        ciphertext = cipher.encrypt_with_aad(plaintext, b"aad")
+
+        out = bytearray(2000)
+        assert cipher.decrypt_into(out, ciphertext, b"aad") == len(plaintext)
+        assert out[: len(plaintext)] == plaintext
+
+        # Failed authentication leaves no plaintext behind
+        out = bytearray(len(plaintext))
+        with pytest.raises(DecryptionError):
+            cipher.decrypt_into(out, ciphertext, b"wrong aad")
+        assert out == bytearray(len(plaintext))
+
+    def test_stream_roundtrip(self):
+        cipher = QuantumShield(b"test key material")
+        for size in (0, 100, 250, 300):
+            plaintext = os.urandom(size)
+            sealed = io.BytesIO()
+            assert cipher.encrypt_stream(io.BytesIO(plaintext), sealed, chunk_size=100) == size
+
+            opened = io.BytesIO()
+            assert cipher.decrypt_stream(io.BytesIO(sealed.getvalue()), opened) == size
+            assert opened.getvalue() == plaintext
+
+    def test_stream_truncation_rejected(self):
+        cipher = QuantumShield(b"test key material")
+        sealed = io.BytesIO()
+        cipher.encrypt_stream(io.BytesIO(os.urandom(300)), sealed, chunk_size=100)
+
+        # Drop the final (empty) frame, leaving only complete chunks
+        truncated = sealed.getvalue()[:-(AES_TAG_SIZE + CHACHA_TAG_SIZE)]
+        with pytest.raises((DecryptionError, InvalidCiphertextError)):
+            cipher.decrypt_stream(io.BytesIO(truncated), io.BytesIO())
+
+    def test_stream_single_layer(self):
+        cipher = QuantumShield(b"test key material", cascade=False)
+        plaintext = os.urandom(250)
+        sealed = io.BytesIO()
+        cipher.encrypt_stream(io.BytesIO(plaintext), sealed, chunk_size=100)
+        opened = io.BytesIO()
+        cipher.decrypt_stream(io.BytesIO(sealed.getvalue()), opened)
+        assert opened.getvalue() == plaintext
+
+    def test_stream_oversized_chunk_header_rejected(self):
+        # version 2, a 1 GiB chunk size and a zero salt: refused before any read
+        header = bytes([2]) + (1 << 30).to_bytes(4, "big") + bytes(32)
+        with pytest.raises(InvalidCiphertextError):
+            QuantumShield(b"test key material").decrypt_stream(
+                io.BytesIO(header), io.BytesIO()
+            )
+
     def test_seal_open(self):
         cipher = QuantumShield(b"test key material")
         plaintext = b"Test message"
@@ -195,6 +313,28 @@ class TestQuantumShield:
         assert QuantumShield.overhead() == QSHIELD_OVERHEAD
         assert QuantumShield.overhead() == 56
 
+    def test_message_overhead(self):
+        assert QuantumShield(b"test key material").message_overhead() == QSHIELD_OVERHEAD
+        single = QuantumShield(b"test key material", cascade=False)
+        assert single.message_overhead() == QSHIELD_SINGLE_OVERHEAD == 28
+        assert len(single.encrypt(b"Test message")) == len(b"Test message") + 28
+
+    def test_single_layer_mode(self):
+        single = QuantumShield(b"test key material", cascade=False)
+        plaintext = b"Test message"
+
+        ciphertext = single.encrypt(plaintext)
+        assert len(ciphertext) == len(plaintext) + QSHIELD_SINGLE_OVERHEAD
+        assert single.decrypt(ciphertext) == plaintext
+
+        sealed = single.encrypt_with_aad(plaintext, b"aad")
+        assert single.decrypt_with_aad(sealed, b"aad") == plaintext
+
+        # Not interchangeable with the cascaded wire format
+        cascaded = QuantumShield(b"test key material")
+        with pytest.raises(DecryptionError):
+            cascaded.decrypt(single.encrypt(bytes(64)))
+
 
 # ===========================================================================
 # QShieldKEM tests
@@ -204,9 +344,7 @@ class TestQShieldKEM:
     """Tests for the hybrid key encapsulation mechanism."""
 
     def test_generate_keypair(self):
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", PostQuantumUnavailableWarning)
-            public_key, secret_key = QShieldKEM.generate_keypair()
+        public_key, secret_key = QShieldKEM.generate_keypair()
 
         assert isinstance(public_key, QShieldKEMPublicKey)
         assert isinstance(secret_key, QShieldKEMSecretKey)
@@ -214,56 +352,58 @@ class TestQShieldKEM:
         assert len(secret_key.x25519) == 32
 
     def test_encapsulate_decapsulate(self):
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", PostQuantumUnavailableWarning)
-            public_key, secret_key = QShieldKEM.generate_keypair()
-            ciphertext, shared_secret_enc = QShieldKEM.encapsulate(public_key)
-            shared_secret_dec = QShieldKEM.decapsulate(secret_key, ciphertext)
+        public_key, secret_key = QShieldKEM.generate_keypair()
+        ciphertext, shared_secret_enc = QShieldKEM.encapsulate(public_key)
+        shared_secret_dec = QShieldKEM.decapsulate(secret_key, ciphertext)
 
         assert shared_secret_enc == shared_secret_dec
         assert len(shared_secret_enc) == QSHIELD_SHARED_SECRET_SIZE
 
+    def test_x25519_backends_interoperate(self, monkeypatch):
+        import quantum_shield.kem as kem_module
+
+        pk, sk = QShieldKEM.generate_keypair()
+        ct, ss = QShieldKEM.encapsulate(pk)
+        monkeypatch.setattr(kem_module, "_scalarmult", None)
+        assert QShieldKEM.decapsulate(sk, ct) == ss
+
+        ct, ss = QShieldKEM.encapsulate(pk)
+        monkeypatch.undo()
+        assert QShieldKEM.decapsulate(sk, ct) == ss
+
     def test_shared_secret_size(self):
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", PostQuantumUnavailableWarning)
-            pk, _ = QShieldKEM.generate_keypair()
-            _, ss = QShieldKEM.encapsulate(pk)
+        pk, _ = QShieldKEM.generate_keypair()
+        _, ss = QShieldKEM.encapsulate(pk)
 
         assert len(ss) == QShieldKEM.shared_secret_size()
 
     def test_different_keys_different_secrets(self):
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", PostQuantumUnavailableWarning)
-            pk1, sk1 = QShieldKEM.generate_keypair()
-            pk2, sk2 = QShieldKEM.generate_keypair()
+        pk1, sk1 = QShieldKEM.generate_keypair()
+        pk2, sk2 = QShieldKEM.generate_keypair()
 
-            _, ss1 = QShieldKEM.encapsulate(pk1)
-            _, ss2 = QShieldKEM.encapsulate(pk2)
+        _, ss1 = QShieldKEM.encapsulate(pk1)
+        _, ss2 = QShieldKEM.encapsulate(pk2)
 
         # Different public keys should give different secrets
         assert ss1 != ss2
 
     def test_wrong_key_decapsulation(self):
         """Decapsulating with the wrong key should give a different shared secret."""
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", PostQuantumUnavailableWarning)
-            pk1, sk1 = QShieldKEM.generate_keypair()
-            _, sk2 = QShieldKEM.generate_keypair()
+        pk1, sk1 = QShieldKEM.generate_keypair()
+        _, sk2 = QShieldKEM.generate_keypair()
 
-            ct, ss_enc = QShieldKEM.encapsulate(pk1)
+        ct, ss_enc = QShieldKEM.encapsulate(pk1)
 
-            # Correct decapsulation
-            ss_dec_correct = QShieldKEM.decapsulate(sk1, ct)
-            assert ss_dec_correct == ss_enc
+        # Correct decapsulation
+        ss_dec_correct = QShieldKEM.decapsulate(sk1, ct)
+        assert ss_dec_correct == ss_enc
 
-            # Wrong key decapsulation -- should NOT match
-            ss_dec_wrong = QShieldKEM.decapsulate(sk2, ct)
-            assert ss_dec_wrong != ss_enc
+        # Wrong key decapsulation -- should NOT match
+        ss_dec_wrong = QShieldKEM.decapsulate(sk2, ct)
+        assert ss_dec_wrong != ss_enc
 
     def test_public_key_serialization(self):
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", PostQuantumUnavailableWarning)
-            pk, _ = QShieldKEM.generate_keypair()
+        pk, _ = QShieldKEM.generate_keypair()
 
         serialized = pk.to_bytes()
         restored = QShieldKEMPublicKey.from_bytes(serialized)
@@ -271,9 +411,7 @@ class TestQShieldKEM:
         assert restored.ml_kem == pk.ml_kem
 
     def test_secret_key_serialization(self):
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", PostQuantumUnavailableWarning)
-            _, sk = QShieldKEM.generate_keypair()
+        _, sk = QShieldKEM.generate_keypair()
 
         serialized = sk.to_bytes()
         restored = QShieldKEMSecretKey.from_bytes(serialized)
@@ -281,10 +419,8 @@ class TestQShieldKEM:
         assert restored.ml_kem == sk.ml_kem
 
     def test_ciphertext_serialization(self):
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", PostQuantumUnavailableWarning)
-            pk, sk = QShieldKEM.generate_keypair()
-            ct, _ = QShieldKEM.encapsulate(pk)
+        pk, sk = QShieldKEM.generate_keypair()
+        ct, _ = QShieldKEM.encapsulate(pk)
 
         serialized = ct.to_bytes()
         restored = QShieldKEMCiphertext.from_bytes(serialized)
@@ -292,19 +428,15 @@ class TestQShieldKEM:
         assert restored.ml_kem == ct.ml_kem
 
         # Verify decapsulation works with restored ciphertext
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", PostQuantumUnavailableWarning)
-            ss1 = QShieldKEM.decapsulate(sk, ct)
-            ss2 = QShieldKEM.decapsulate(sk, restored)
+        ss1 = QShieldKEM.decapsulate(sk, ct)
+        ss2 = QShieldKEM.decapsulate(sk, restored)
         assert ss1 == ss2
 
     def test_full_kem_to_cipher_flow(self):
         """End-to-end: KEM -> shared secret -> QuantumShield cipher."""
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", PostQuantumUnavailableWarning)
-            pk, sk = QShieldKEM.generate_keypair()
-            ct, ss_enc = QShieldKEM.encapsulate(pk)
-            ss_dec = QShieldKEM.decapsulate(sk, ct)
+        pk, sk = QShieldKEM.generate_keypair()
+        ct, ss_enc = QShieldKEM.encapsulate(pk)
+        ss_dec = QShieldKEM.decapsulate(sk, ct)
 
         assert ss_enc == ss_dec
 
@@ -321,92 +453,120 @@ class TestQShieldKEM:
 # QShieldSign tests
 # ===========================================================================
 
+@pytest.fixture(scope="module")
+def signed_payload(qshield_sign_keypair):
+    """``(pk, sk, msg, sig)``: one untimed signature shared by read-only tests."""
+    pk, sk = qshield_sign_keypair
+    msg = b"Test"
+    return pk, sk, msg, QShieldSign.sign(sk, msg)
+
+
+@pytest.fixture(scope="module")
+def timestamped_payload(qshield_sign_keypair):
+    """``(pk, sk, msg, sig)`` with the signature timestamped at 42."""
+    pk, sk = qshield_sign_keypair
+    msg = b"Test"
+    return pk, sk, msg, QShieldSign.sign_with_timestamp(sk, msg, timestamp=42)
+
+
 class TestQShieldSign:
     """Tests for the dual signature scheme."""
 
     def test_generate_keypair(self):
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", PostQuantumUnavailableWarning)
-            pk, sk = QShieldSign.generate_keypair()
+        pk, sk = QShieldSign.generate_keypair()
 
         assert isinstance(pk, QShieldSignPublicKey)
         assert isinstance(sk, QShieldSignSecretKey)
         assert len(pk.primary) > 0
         assert len(pk.secondary) > 0
 
-    def test_sign_verify(self):
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", PostQuantumUnavailableWarning)
-            pk, sk = QShieldSign.generate_keypair()
-            signature = QShieldSign.sign(sk, b"Hello, quantum world!")
-            valid = QShieldSign.verify(pk, b"Hello, quantum world!", signature)
+    def test_sign_verify(self, qshield_sign_keypair):
+        pk, sk = qshield_sign_keypair
+        signature = QShieldSign.sign(sk, b"Hello, quantum world!")
+        valid = QShieldSign.verify(pk, b"Hello, quantum world!", signature)
 
         assert valid is True
 
+    def test_replaced_secret_field_is_reparsed(
+        self, qshield_sign_keypair, qshield_sign_keypair_alt
+    ):
+        pk, shared_sk = qshield_sign_keypair
+        _, other = qshield_sign_keypair_alt
+        # Mutated below, so work on a private copy of the session key
+        sk = QShieldSignSecretKey.from_bytes(shared_sk.to_bytes())
+        assert QShieldSign.verify(pk, b"msg", QShieldSign.sign(sk, b"msg"))
+
+        sk.secondary = other.secondary
+        signature = QShieldSign.sign(sk, b"msg")
+        assert signature.secondary == QShieldSign.sign(other, b"msg").secondary
+        assert QShieldSign.verify(pk, b"msg", signature) is False
+
+    def test_verify_batch(self, qshield_sign_keypair):
+        pk, sk = qshield_sign_keypair
+        messages = [b"a", b"b", b"c", b"d"]
+        signatures = [QShieldSign.sign(sk, m) for m in messages]
+        keys = [pk] * len(messages)
+        messages[2] = b"tampered"
+
+        expected = [True, True, False, True]
+        assert QShieldSign.verify_batch(keys, messages, signatures) == expected
+        assert (
+            QShieldSign.verify_batch(keys, messages, signatures, workers=3)
+            == expected
+        )
+
+        with pytest.raises(SignatureError):
+            QShieldSign.verify_batch(keys, messages[:3], signatures)
+
     def test_sign_verify_with_timestamp(self):
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", PostQuantumUnavailableWarning)
-            pk, sk = QShieldSign.generate_keypair()
-            timestamp = 1704067200  # 2024-01-01 00:00:00 UTC
-            signature = QShieldSign.sign_with_timestamp(
-                sk, b"Hello!", timestamp=timestamp
-            )
+        pk, sk = QShieldSign.generate_keypair()
+        timestamp = 1704067200  # 2024-01-01 00:00:00 UTC
+        signature = QShieldSign.sign_with_timestamp(
+            sk, b"Hello!", timestamp=timestamp
+        )
 
         assert signature.timestamp == timestamp
 
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", PostQuantumUnavailableWarning)
-            valid = QShieldSign.verify(pk, b"Hello!", signature)
+        valid = QShieldSign.verify(pk, b"Hello!", signature)
         assert valid is True
 
-    def test_wrong_message_fails(self):
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", PostQuantumUnavailableWarning)
-            pk, sk = QShieldSign.generate_keypair()
-            signature = QShieldSign.sign(sk, b"Hello!")
-            valid = QShieldSign.verify(pk, b"Wrong message", signature)
+    def test_wrong_message_fails(self, qshield_sign_keypair):
+        pk, sk = qshield_sign_keypair
+        signature = QShieldSign.sign(sk, b"Hello!")
+        valid = QShieldSign.verify(pk, b"Wrong message", signature)
 
         assert valid is False
 
-    def test_wrong_key_fails(self):
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", PostQuantumUnavailableWarning)
-            _, sk1 = QShieldSign.generate_keypair()
-            pk2, _ = QShieldSign.generate_keypair()
-
-            signature = QShieldSign.sign(sk1, b"Test message")
-            valid = QShieldSign.verify(pk2, b"Test message", signature)
+    def test_wrong_key_fails(self, qshield_sign_keypair, qshield_sign_keypair_alt):
+        _, sk1 = qshield_sign_keypair
+        pk2, _ = qshield_sign_keypair_alt
+        signature = QShieldSign.sign(sk1, b"Test message")
+        valid = QShieldSign.verify(pk2, b"Test message", signature)
 
         assert valid is False
 
-    def test_public_key_serialization(self):
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", PostQuantumUnavailableWarning)
-            pk, _ = QShieldSign.generate_keypair()
-
+    def test_public_key_serialization(self, qshield_sign_keypair):
+        pk, _ = qshield_sign_keypair
         serialized = pk.to_bytes()
         restored = QShieldSignPublicKey.from_bytes(serialized)
         assert restored.primary == pk.primary
         assert restored.secondary == pk.secondary
         assert restored.scheme == pk.scheme
 
-    def test_secret_key_serialization(self):
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", PostQuantumUnavailableWarning)
-            _, sk = QShieldSign.generate_keypair()
-
+    def test_secret_key_serialization(self, qshield_sign_keypair):
+        _, sk = qshield_sign_keypair
         serialized = sk.to_bytes()
         restored = QShieldSignSecretKey.from_bytes(serialized)
         assert restored.primary == sk.primary
         assert restored.secondary == sk.secondary
         assert restored.scheme == sk.scheme
+        assert restored == sk
+        assert restored != QShieldSignSecretKey(
+            sk.primary, bytes(len(sk.secondary)), sk.scheme
+        )
 
-    def test_signature_serialization(self):
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", PostQuantumUnavailableWarning)
-            pk, sk = QShieldSign.generate_keypair()
-            sig = QShieldSign.sign(sk, b"Test")
-
+    def test_signature_serialization(self, signed_payload):
+        pk, _, msg, sig = signed_payload
         serialized = sig.to_bytes()
         restored = QShieldSignature.from_bytes(serialized)
 
@@ -416,30 +576,34 @@ class TestQShieldSign:
         assert restored.timestamp == sig.timestamp
 
         # Verify the restored signature still works
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", PostQuantumUnavailableWarning)
-            assert QShieldSign.verify(pk, b"Test", restored) is True
-
-    def test_signature_with_timestamp_serialization(self):
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", PostQuantumUnavailableWarning)
-            pk, sk = QShieldSign.generate_keypair()
-            sig = QShieldSign.sign_with_timestamp(sk, b"Test", timestamp=42)
-
+        assert QShieldSign.verify(pk, msg, restored) is True
+
+        for buffer in (bytearray(serialized), memoryview(serialized)):
+            parsed = QShieldSignature.from_bytes(buffer)
+            assert type(parsed.primary) is bytes
+            assert parsed == restored
+
+    def test_truncated_signature_rejected(self, timestamped_payload):
+        pk, _, _, sig = timestamped_payload
+        for data, parse in (
+            (sig.to_bytes(), QShieldSignature.from_bytes),
+            (pk.to_bytes(), QShieldSignPublicKey.from_bytes),
+        ):
+            for cut in (1, 8, len(data) // 2, len(data) - 1):
+                with pytest.raises(ParseError):
+                    parse(data[:cut])
+
+    def test_signature_with_timestamp_serialization(self, timestamped_payload):
+        pk, _, msg, sig = timestamped_payload
         serialized = sig.to_bytes()
         restored = QShieldSignature.from_bytes(serialized)
         assert restored.timestamp == 42
 
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", PostQuantumUnavailableWarning)
-            assert QShieldSign.verify(pk, b"Test", restored) is True
-
-    def test_fingerprint(self):
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", PostQuantumUnavailableWarning)
-            pk1, _ = QShieldSign.generate_keypair()
-            pk2, _ = QShieldSign.generate_keypair()
+        assert QShieldSign.verify(pk, msg, restored) is True
 
+    def test_fingerprint(self, qshield_sign_keypair, qshield_sign_keypair_alt):
+        pk1, _ = qshield_sign_keypair
+        pk2, _ = qshield_sign_keypair_alt
         fp1 = pk1.fingerprint()
         fp2 = pk2.fingerprint()
 
@@ -449,20 +613,26 @@ class TestQShieldSign:
         # Same key -> same fingerprint
         assert pk1.fingerprint() == fp1
 
-    def test_empty_message(self):
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", PostQuantumUnavailableWarning)
-            pk, sk = QShieldSign.generate_keypair()
-            sig = QShieldSign.sign(sk, b"")
-            assert QShieldSign.verify(pk, b"", sig) is True
+        # Replacing a field invalidates the memoized fingerprint (on a copy,
+        # since the keypair is shared)
+        pk = QShieldSignPublicKey(pk1.primary, pk1.secondary, pk1.scheme)
+        assert pk.fingerprint() == fp1
+        pk.secondary = pk2.secondary
+        assert pk.fingerprint() not in (fp1, fp2)
+        pk.primary = pk2.primary
+        assert pk.fingerprint() == fp2
 
-    def test_large_message(self):
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", PostQuantumUnavailableWarning)
-            pk, sk = QShieldSign.generate_keypair()
-            msg = os.urandom(1024 * 100)  # 100 KiB
-            sig = QShieldSign.sign(sk, msg)
-            assert QShieldSign.verify(pk, msg, sig) is True
+    def test_empty_message(self, qshield_sign_keypair):
+        pk, sk = qshield_sign_keypair
+        sig = QShieldSign.sign(sk, b"")
+        assert QShieldSign.verify(pk, b"", sig) is True
+
+    def test_large_message(self, qshield_sign_keypair):
+        pk, sk = qshield_sign_keypair
+        # 100 KiB of deterministic, random-looking content
+        msg = hashlib.shake_128(b"test_large_message").digest(1024 * 100)
+        sig = QShieldSign.sign(sk, msg)
+        assert QShieldSign.verify(pk, msg, sig) is True
 
 
 # ===========================================================================
@@ -501,7 +671,9 @@ class TestQShieldKDF:
 
         # HKDF produces output where a shorter request IS a prefix of a
         # longer one (same PRK, same info, output is a truncated expansion).
-        # Verify this property holds.
+        # Verify this property holds. The three lengths are derived
+        # separately on purpose: slicing one 64-byte derive would make these
+        # checks tautological instead of exercising derive's own truncation.
         assert key16 == key32[:16]
         assert key32 == key64[:32]
 
@@ -520,6 +692,41 @@ class TestQShieldKDF:
         key2 = kdf.derive(b"ikm", b"", b"info", 32)
         assert key1 == key2
 
+    def test_derive_with_hash_algorithm(self):
+        """An explicit HKDF hash changes the key; the default stays SHA-512."""
+        from cryptography.hazmat.primitives import hashes
+
+        kdf = QShieldKDF()
+        default = kdf.derive(b"ikm", b"", b"info", 32)
+        sha512 = kdf.derive(b"ikm", b"", b"info", 32, algorithm=hashes.SHA512())
+        sha256 = kdf.derive(b"ikm", b"", b"info", 32, algorithm=hashes.SHA256())
+        assert default == sha512
+        assert kdf.derive(b"ikm", b"", b"info", 200) == kdf.derive(
+            b"ikm", b"", b"info", 200, algorithm=hashes.SHA512()
+        )
+        assert sha256 != sha512
+        assert len(sha256) == 32
+
+    def test_derive_many(self):
+        kdf = QShieldKDF()
+        infos, lengths = [b"enc", b"mac", b"iv"], [32, 64, 100]
+        for salt in (b"", b"salt"):
+            keys = kdf.derive_many(b"ikm", salt, infos, lengths)
+            assert keys == [kdf.derive(b"ikm", salt, i, n) for i, n in zip(infos, lengths)]
+
+        with pytest.raises(KeyDerivationError):
+            kdf.derive_many(b"ikm", b"", infos, [32])
+
+    def test_derive_batch(self):
+        kdf = QShieldKDF()
+        ikms = [b"one", b"two", b"three"]
+        salts = [b"", b"salt", b"salt"]
+        keys = kdf.derive_batch(ikms, salts, [b"info"] * 3, 48)
+        assert keys == [kdf.derive(i, s, b"info", 48) for i, s in zip(ikms, salts)]
+
+        with pytest.raises(KeyDerivationError):
+            kdf.derive_batch(ikms, salts[:2], [b"info"] * 3, 48)
+
     def test_derive_with_salt(self):
         kdf = QShieldKDF()
         key, salt = kdf.derive_with_salt(b"ikm", b"info", 32)
@@ -542,6 +749,13 @@ class TestQShieldKDF:
         combined_rev = kdf.combine([key2, key1], b"QShieldKEM-v1", 32)
         assert combined != combined_rev
 
+        # Length-prefixed framing, including the 32-byte pair used by the KEM
+        a, b = b"a" * 32, b"b" * 32
+        framed = b"\x20\0\0\0" + a + b"\x20\0\0\0" + b + b"\x02\0\0\0"
+        assert kdf.combine([a, b], b"info", 64) == kdf.derive(framed, b"", b"info", 64)
+        framed = b"\x20\0\0\0" + a + b"\x01\0\0\0"
+        assert kdf.combine([a], b"info", 64) == kdf.derive(framed, b"", b"info", 64)
+
     def test_expand(self):
         kdf = QShieldKDF()
         expanded = kdf.expand(b"seed key", b"expansion context", 128)
@@ -551,10 +765,13 @@ class TestQShieldKDF:
         expanded2 = kdf.expand(b"seed key", b"expansion context", 128)
         assert expanded == expanded2
 
+        batch = kdf.expand_batch([b"seed key", b"other"], [b"expansion context", b"x"], 128)
+        assert batch == [expanded, kdf.expand(b"other", b"x", 128)]
+
     def test_password_derive(self):
-        kdf = QShieldKDF(config=KdfConfig.low_memory())
+        kdf = QShieldKDF(config=FAST_ARGON2)
         password = b"my secure password"
-        salt = QShieldKDF.generate_salt(32)
+        salt = SALT_A
 
         key = kdf.derive_from_password(password, salt, 32)
         assert len(key) == 32
@@ -568,11 +785,11 @@ class TestQShieldKDF:
         assert key != key3
 
         # Different salt -> different key
-        key4 = kdf.derive_from_password(password, QShieldKDF.generate_salt(32), 32)
+        key4 = kdf.derive_from_password(password, SALT_B, 32)
         assert key != key4
 
     def test_password_derive_max_length(self):
-        kdf = QShieldKDF(config=KdfConfig.low_memory())
+        kdf = QShieldKDF(config=FAST_ARGON2)
         with pytest.raises(KeyDerivationError):
             kdf.derive_from_password(b"password", b"salt" * 8, 1025)
 
@@ -598,6 +815,10 @@ class TestQShieldKDF:
         assert low.time_cost == 4
         assert low.parallelism == 2
 
+        tuned = KdfConfig.host_tuned()
+        assert tuned.memory_cost == 262144
+        assert 1 <= tuned.parallelism <= 8
+
 
 # ===========================================================================
 # DerivedKey tests
@@ -611,10 +832,14 @@ class TestDerivedKey:
         assert len(key) == 4
         assert key.as_bytes() == b"\x01\x02\x03\x04"
         assert bytes(key) == b"\x01\x02\x03\x04"
+        assert key[1] == 2
+        assert key[1:3] == b"\x02\x03"
 
     def test_split(self):
-        key = DerivedKey(os.urandom(64))
+        material = bytes(range(64))  # distinct bytes expose any reordering
+        key = DerivedKey(material)
         parts = key.split([16, 16, 32])
+        assert [p.as_bytes() for p in parts] == [material[:16], material[16:32], material[32:]]
         assert len(parts) == 3
         assert len(parts[0]) == 16
         assert len(parts[1]) == 16
@@ -638,55 +863,48 @@ class TestDerivedKey:
 class TestIntegration:
     """End-to-end integration tests."""
 
-    def test_full_workflow(self):
+    @pytest.mark.smoke
+    def test_full_workflow(self, qshield_kem_keypair, qshield_sign_keypair):
         """Complete workflow: keygen -> encapsulate -> encrypt -> decrypt -> verify."""
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", PostQuantumUnavailableWarning)
-
-            # Key exchange
-            pk_kem, sk_kem = QShieldKEM.generate_keypair()
-            ct_kem, ss_sender = QShieldKEM.encapsulate(pk_kem)
-            ss_receiver = QShieldKEM.decapsulate(sk_kem, ct_kem)
-            assert ss_sender == ss_receiver
-
-            # Symmetric encryption
-            cipher = QuantumShield(ss_sender)
-            message = b"Top secret message for quantum-safe transmission"
-            encrypted = cipher.encrypt(message)
-            decrypted = cipher.decrypt(encrypted)
-            assert decrypted == message
-
-            # Signing
-            pk_sign, sk_sign = QShieldSign.generate_keypair()
-            signature = QShieldSign.sign(sk_sign, encrypted)
-            assert QShieldSign.verify(pk_sign, encrypted, signature)
+        # Key exchange
+        pk_kem, sk_kem = qshield_kem_keypair
+        ct_kem, ss_sender = QShieldKEM.encapsulate(pk_kem)
+        ss_receiver = QShieldKEM.decapsulate(sk_kem, ct_kem)
+        assert ss_sender == ss_receiver
+
+        # Symmetric encryption
+        cipher = QuantumShield(ss_sender)
+        message = b"Top secret message for quantum-safe transmission"
+        encrypted = cipher.encrypt(message)
+        decrypted = cipher.decrypt(encrypted)
+        assert decrypted == message
+
+        # Signing
+        pk_sign, sk_sign = qshield_sign_keypair
+        signature = QShieldSign.sign(sk_sign, encrypted)
+        assert QShieldSign.verify(pk_sign, encrypted, signature)
 
     def test_kdf_to_cipher(self):
         """Derive a key from password and use it for encryption."""
-        kdf = QShieldKDF(config=KdfConfig.low_memory())
-        salt = QShieldKDF.generate_salt(32)
-        key = kdf.derive_from_password(b"hunter2", salt, 32)
+        kdf = QShieldKDF(config=FAST_ARGON2)
+        key = kdf.derive_from_password(b"hunter2", SALT_A, 32)
 
         cipher = QuantumShield(key)
         ct = cipher.encrypt(b"password-protected data")
         pt = cipher.decrypt(ct)
         assert pt == b"password-protected data"
 
-    def test_multiple_messages_same_key(self):
+    def test_multiple_messages_same_key(self, qshield_kem_keypair):
         """Encrypt multiple messages with the same key."""
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", PostQuantumUnavailableWarning)
-            pk, sk = QShieldKEM.generate_keypair()
-            ct, ss = QShieldKEM.encapsulate(pk)
-            ss2 = QShieldKEM.decapsulate(sk, ct)
+        pk, sk = qshield_kem_keypair
+        ct, ss = QShieldKEM.encapsulate(pk)
+        ss2 = QShieldKEM.decapsulate(sk, ct)
 
         cipher = QuantumShield(ss)
         cipher2 = QuantumShield(ss2)
 
-        for i in range(10):
-            msg = f"Message #{i}".encode()
-            encrypted = cipher.encrypt(msg)
-            assert cipher2.decrypt(encrypted) == msg
+        msgs = [f"Message #{i}".encode() for i in range(10)]
+        assert cipher2.decrypt_many(cipher.encrypt_many(msgs)) == msgs
 
     def test_key_rotation_flow(self):
         """Key rotation during a session."""
@@ -715,14 +933,20 @@ class TestIntegration:
 class TestErrors:
     """Test that errors are properly raised and form a hierarchy."""
 
-    def test_error_hierarchy(self):
-        assert issubclass(InvalidKeyError, QShieldError)
-        assert issubclass(EncryptionError, QShieldError)
-        assert issubclass(DecryptionError, QShieldError)
-        assert issubclass(InvalidCiphertextError, QShieldError)
-        assert issubclass(KeyDerivationError, QShieldError)
-        assert issubclass(SignatureError, QShieldError)
-        assert issubclass(ParseError, QShieldError)
+    @pytest.mark.parametrize(
+        "exc",
+        [
+            InvalidKeyError,
+            EncryptionError,
+            DecryptionError,
+            InvalidCiphertextError,
+            KeyDerivationError,
+            SignatureError,
+            ParseError,
+        ],
+    )
+    def test_error_hierarchy(self, exc):
+        assert issubclass(exc, QShieldError)
 
     def test_catching_base_error(self):
         """All specific errors can be caught as QShieldError."""
@@ -37,7 +37,8 @@
 //! ```
 
 #![cfg_attr(not(feature = "std"), no_std)]
-#![forbid(unsafe_code)]
+// PyO3's generated glue is unsafe, so the forbid is lifted for that feature only
+#![cfg_attr(not(feature = "python"), forbid(unsafe_code))]
 #![warn(missing_docs, rust_2018_idioms)]
 
 #[cfg(not(feature = "std"))]
@@ -51,6 +52,9 @@ pub mod sign;
 pub mod symmetric;
 pub mod utils;
 
+#[cfg(feature = "python")]
+mod python;
+
 // Re-export main types for convenience
 pub use error::{QShieldError, Result};
 pub use kdf::QShieldKDF;
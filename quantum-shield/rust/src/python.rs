@@ -0,0 +1,168 @@
+//! Python bindings (`python` feature)
+//!
+//! Exposes the cascade's per-message work as `quantum_shield._native` so the
+//! pure-Python package can seal or open a message in a single native call.
+//! Key derivation and rotation stay in Python; this module only receives the
+//! derived key material. The compiled library must be installed as
+//! `quantum_shield/_native` (e.g. maturin with
+//! `module-name = "quantum_shield._native"` and `--features python`).
+//!
+//! The wire format is identical to [`crate::QuantumShield`]:
+//! `chacha_nonce || ChaCha20-Poly1305(aes_nonce || AES-256-GCM(plaintext))`.
+
+use aes_gcm::aead::generic_array::GenericArray;
+use aes_gcm::aead::{AeadInPlace, KeyInit};
+use aes_gcm::Aes256Gcm;
+use chacha20poly1305::ChaCha20Poly1305;
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use pyo3::types::PyBytes;
+use zeroize::Zeroizing;
+
+use crate::error::QShieldError;
+use crate::utils::rng::fill_random;
+
+const AES_KEY_SIZE: usize = 32;
+const AES_NONCE_SIZE: usize = 12;
+const AES_TAG_SIZE: usize = 16;
+const CHACHA_KEY_SIZE: usize = 32;
+const CHACHA_NONCE_SIZE: usize = 12;
+const CHACHA_TAG_SIZE: usize = 16;
+const OVERHEAD: usize = AES_NONCE_SIZE + AES_TAG_SIZE + CHACHA_NONCE_SIZE + CHACHA_TAG_SIZE;
+
+fn to_py_err(err: QShieldError) -> PyErr {
+    PyValueError::new_err(err.to_string())
+}
+
+/// Cascade cipher with both layer keys already expanded
+#[pyclass(module = "quantum_shield._native")]
+pub struct NativeCascade {
+    aes: Aes256Gcm,
+    chacha: ChaCha20Poly1305,
+}
+
+#[pymethods]
+impl NativeCascade {
+    /// Takes the derived `aes_key || chacha_key` material as one buffer, so
+    /// Python never slices (and copies) the individual keys
+    #[new]
+    fn new(key_material: &[u8]) -> PyResult<Self> {
+        if key_material.len() != AES_KEY_SIZE + CHACHA_KEY_SIZE {
+            return Err(to_py_err(QShieldError::InvalidKey));
+        }
+        let (aes_key, chacha_key) = key_material.split_at(AES_KEY_SIZE);
+        Ok(Self {
+            aes: Aes256Gcm::new(GenericArray::from_slice(aes_key)),
+            chacha: ChaCha20Poly1305::new(GenericArray::from_slice(chacha_key)),
+        })
+    }
+
+    /// Encrypt both layers in place inside the returned `bytes` object
+    #[pyo3(signature = (plaintext, aad = None))]
+    fn encrypt<'py>(
+        &self,
+        py: Python<'py>,
+        plaintext: &[u8],
+        aad: Option<&[u8]>,
+    ) -> PyResult<&'py PyBytes> {
+        let aad = aad.unwrap_or_default();
+        PyBytes::new_with(py, OVERHEAD + plaintext.len(), |out| {
+            // The output is not visible to Python yet and the inputs are
+            // immutable bytes, so the cipher work runs without the GIL
+            py.allow_threads(|| self.seal_into(out, plaintext, aad))
+                .map_err(to_py_err)
+        })
+    }
+
+    /// Strip both layers, decrypting in a single scratch buffer
+    #[pyo3(signature = (ciphertext, aad = None))]
+    fn decrypt<'py>(
+        &self,
+        py: Python<'py>,
+        ciphertext: &[u8],
+        aad: Option<&[u8]>,
+    ) -> PyResult<&'py PyBytes> {
+        if ciphertext.len() < OVERHEAD {
+            return Err(to_py_err(QShieldError::InvalidCiphertext));
+        }
+        let aad = aad.unwrap_or_default();
+        let inner = py
+            .allow_threads(|| self.open_inner(ciphertext, aad))
+            .map_err(to_py_err)?;
+        Ok(PyBytes::new(
+            py,
+            &inner[AES_NONCE_SIZE..inner.len() - AES_TAG_SIZE],
+        ))
+    }
+}
+
+impl NativeCascade {
+    /// Seal both layers into `out`, which is `OVERHEAD` bytes longer than `plaintext`
+    fn seal_into(&self, out: &mut [u8], plaintext: &[u8], aad: &[u8]) -> Result<(), QShieldError> {
+        // Both nonces sit next to each other at the front of the output
+        fill_random(&mut out[..CHACHA_NONCE_SIZE + AES_NONCE_SIZE])?;
+
+        let (chacha_nonce, rest) = out.split_at_mut(CHACHA_NONCE_SIZE);
+        let (inner, chacha_tag) = rest.split_at_mut(rest.len() - CHACHA_TAG_SIZE);
+
+        // Layer 1: AES-256-GCM over aes_nonce || plaintext || tag
+        let (aes_nonce, aes_body) = inner.split_at_mut(AES_NONCE_SIZE);
+        let (aes_ct, aes_tag) = aes_body.split_at_mut(plaintext.len());
+        aes_ct.copy_from_slice(plaintext);
+        let tag = self
+            .aes
+            .encrypt_in_place_detached(GenericArray::from_slice(aes_nonce), aad, aes_ct)
+            .map_err(|_| QShieldError::EncryptionFailed)?;
+        aes_tag.copy_from_slice(&tag);
+
+        // Layer 2: ChaCha20-Poly1305 over the whole inner layer
+        let tag = self
+            .chacha
+            .encrypt_in_place_detached(GenericArray::from_slice(chacha_nonce), aad, inner)
+            .map_err(|_| QShieldError::EncryptionFailed)?;
+        chacha_tag.copy_from_slice(&tag);
+        Ok(())
+    }
+
+    /// Strip both layers, returning `aes_nonce || plaintext || aes_tag`.
+    ///
+    /// The scratch buffer is wiped on drop, so a failed AES tag check does
+    /// not leave the already removed ChaCha layer behind in freed memory.
+    fn open_inner(
+        &self,
+        ciphertext: &[u8],
+        aad: &[u8],
+    ) -> Result<Zeroizing<Vec<u8>>, QShieldError> {
+        let (chacha_nonce, rest) = ciphertext.split_at(CHACHA_NONCE_SIZE);
+        let (inner, chacha_tag) = rest.split_at(rest.len() - CHACHA_TAG_SIZE);
+        let mut inner = Zeroizing::new(inner.to_vec());
+        self.chacha
+            .decrypt_in_place_detached(
+                GenericArray::from_slice(chacha_nonce),
+                aad,
+                &mut *inner,
+                GenericArray::from_slice(chacha_tag),
+            )
+            .map_err(|_| QShieldError::DecryptionFailed)?;
+
+        let (aes_nonce, aes_body) = inner.split_at_mut(AES_NONCE_SIZE);
+        let ct_len = aes_body.len() - AES_TAG_SIZE;
+        let (aes_ct, aes_tag) = aes_body.split_at_mut(ct_len);
+        self.aes
+            .decrypt_in_place_detached(
+                GenericArray::from_slice(aes_nonce),
+                aad,
+                aes_ct,
+                GenericArray::from_slice(aes_tag),
+            )
+            .map_err(|_| QShieldError::DecryptionFailed)?;
+        Ok(inner)
+    }
+}
+
+/// `quantum_shield._native` extension module
+#[pymodule]
+fn _native(_py: Python<'_>, m: &PyModule) -> PyResult<()> {
+    m.add_class::<NativeCascade>()?;
+    Ok(())
+}
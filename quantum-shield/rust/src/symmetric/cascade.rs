@@ -17,6 +17,7 @@ use zeroize::{Zeroize, ZeroizeOnDrop};
 
 use crate::error::{QShieldError, Result};
 use crate::kdf::QShieldKDF;
+use crate::utils::rng::fill_random;
 use crate::utils::serialize::{
     read_length_prefixed, write_length_prefixed, Deserialize, Header, ObjectType, Serialize,
 };
@@ -194,13 +195,7 @@ impl QuantumShield {
     /// # Returns
     /// Cascaded ciphertext
     pub fn encrypt(&self, plaintext: &[u8]) -> Result<Vec<u8>> {
-        // First layer: AES-256-GCM
-        let aes_encrypted = self.aes.encrypt(plaintext, None)?;
-
-        // Second layer: ChaCha20-Poly1305
-        let cascade_encrypted = self.chacha.encrypt(&aes_encrypted, None)?;
-
-        Ok(cascade_encrypted)
+        self.encrypt_layers(plaintext, None)
     }
 
     /// Encrypt data with additional authenticated data
@@ -214,13 +209,32 @@ impl QuantumShield {
     /// # Returns
     /// Cascaded ciphertext
     pub fn encrypt_with_aad(&self, plaintext: &[u8], aad: &[u8]) -> Result<Vec<u8>> {
-        // First layer: AES-256-GCM with AAD
-        let aes_encrypted = self.aes.encrypt(plaintext, Some(aad))?;
-
-        // Second layer: ChaCha20-Poly1305 with AAD
-        let cascade_encrypted = self.chacha.encrypt(&aes_encrypted, Some(aad))?;
+        self.encrypt_layers(plaintext, Some(aad))
+    }
 
-        Ok(cascade_encrypted)
+    /// Run both layers with their nonces drawn in a single RNG call
+    fn encrypt_layers(&self, plaintext: &[u8], aad: Option<&[u8]>) -> Result<Vec<u8>> {
+        let mut nonces = [0u8; CHACHA_NONCE_SIZE + AES_NONCE_SIZE];
+        fill_random(&mut nonces)?;
+
+        let mut chacha_nonce = [0u8; CHACHA_NONCE_SIZE];
+        let mut aes_nonce = [0u8; AES_NONCE_SIZE];
+        chacha_nonce.copy_from_slice(&nonces[..CHACHA_NONCE_SIZE]);
+        aes_nonce.copy_from_slice(&nonces[CHACHA_NONCE_SIZE..]);
+
+        // First layer: AES-256-GCM, nonce prepended
+        let aes_ct = self.aes.encrypt_with_nonce(plaintext, &aes_nonce, aad)?;
+        let mut aes_encrypted = Vec::with_capacity(AES_NONCE_SIZE + aes_ct.len());
+        aes_encrypted.extend_from_slice(&aes_nonce);
+        aes_encrypted.extend_from_slice(&aes_ct);
+
+        // Second layer: ChaCha20-Poly1305, nonce prepended
+        let chacha_ct = self.chacha.encrypt_with_nonce(&aes_encrypted, &chacha_nonce, aad)?;
+        let mut result = Vec::with_capacity(CHACHA_NONCE_SIZE + chacha_ct.len());
+        result.extend_from_slice(&chacha_nonce);
+        result.extend_from_slice(&chacha_ct);
+
+        Ok(result)
     }
 
     /// Decrypt cascaded ciphertext